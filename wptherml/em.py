@@ -1,6 +1,7 @@
 from .spectrum_driver import SpectrumDriver
 from .materials import Materials
 from .therml import Therml
+from functools import lru_cache
 import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.patches import Circle
@@ -8,6 +9,94 @@ import matplotlib.colors as colors
 import matplotlib.cm as cmx
 
 
+@lru_cache(maxsize=None)
+def _gauss_legendre_grid(number_of_nodes, a, b):
+    """Gauss-Legendre quadrature nodes and weights mapped from [-1, 1] to [a, b],
+    cached so that the nodes are only computed once per grid
+    Arguments
+    ---------
+        number_of_nodes : int
+            the number of quadrature nodes
+        a : float
+            lower limit of the integral
+        b : float
+            upper limit of the integral
+    Returns
+    -------
+        x : 1 x number_of_nodes numpy array of floats
+            the nodes on [-1, 1]
+        vals : 1 x number_of_nodes numpy array of floats
+            the nodes on [a, b]
+        weights : 1 x number_of_nodes numpy array of floats
+            the weights for integrals over [a, b]
+    """
+    x, weights = np.polynomial.legendre.leggauss(number_of_nodes)
+    vals = 0.5 * (x + 1) * (b - a) + a
+    weights = weights * 0.5 * (b - a)
+
+    # the cached arrays are shared between all callers
+    for _array in (x, vals, weights):
+        _array.setflags(write=False)
+    return x, vals, weights
+
+
+def _compute_cos_sin(phil):
+    """cosine and sine of the (complex) phase phil from a single exponential
+    Arguments
+    ---------
+        phil : complex float or numpy array of complex floats
+            kz * d of a layer
+    Returns
+    -------
+        _cos_phil : complex float or numpy array of complex floats
+            cos(phil) = (exp(i phil) + exp(-i phil)) / 2
+        _sin_phil : complex float or numpy array of complex floats
+            sin(phil) = (exp(i phil) - exp(-i phil)) / 2i
+    Notes
+    -----
+    exp(-i phil) is obtained as the reciprocal of exp(i phil), so only one
+    transcendental is evaluated instead of the two (each costing about one
+    complex exponential) behind np.cos and np.sin
+    """
+    _exp_pos = np.exp(1j * phil)
+    _exp_neg = 1 / _exp_pos
+    return 0.5 * (_exp_pos + _exp_neg), -0.5j * (_exp_pos - _exp_neg)
+
+
+def _matmul_2x2(a, b, out=None):
+    """multiply two stacks of 2 x 2 matrices with the product written out element
+    by element, broadcasting over the leading axes
+    Arguments
+    ---------
+        a : ... x 2 x 2 numpy array of complex floats
+        b : ... x 2 x 2 numpy array of complex floats
+        out : ... x 2 x 2 numpy array of complex floats, optional
+            array the product is written to; must not share memory with a or b
+    Returns
+    -------
+        out : ... x 2 x 2 numpy array of complex floats
+            the product a @ b
+    Notes
+    -----
+    For the fixed 2 x 2 shape, eight multiplies and four adds over flat
+    wavelength arrays are faster than the generic small-matrix loop of np.matmul
+    """
+    if out is None:
+        out = np.empty(
+            np.broadcast_shapes(np.shape(a), np.shape(b)),
+            dtype=np.result_type(a, b),
+        )
+    _a00, _a01, _a10, _a11 = a[..., 0, 0], a[..., 0, 1], a[..., 1, 0], a[..., 1, 1]
+    _b00, _b01, _b10, _b11 = b[..., 0, 0], b[..., 0, 1], b[..., 1, 0], b[..., 1, 1]
+
+    out[..., 0, 0] = _a00 * _b00 + _a01 * _b10
+    out[..., 0, 1] = _a00 * _b01 + _a01 * _b11
+    out[..., 1, 0] = _a10 * _b00 + _a11 * _b10
+    out[..., 1, 1] = _a10 * _b01 + _a11 * _b11
+
+    return out
+
+
 class TmmDriver(SpectrumDriver, Materials, Therml):
     """Collects methods for computing the reflectivity, absorptivity/emissivity, and transmissivity
        of multilayer structures using the Transfer Matrix Method.
@@ -34,9 +123,9 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         the transmission spectrum
     emissivity_array : 1 x number_of_wavelengths numpy array of floats
         the absorptivity / emissivity spectrum
-    _refractive_index_array : number_of_layers x number_of_wavelengths numpy array of complex floats
+    _refractive_index_array : number_of_wavelengths x number_of_layers numpy array of complex floats
         the array of refractive index values corresponding to wavelength_array
-    _tm : 2 x 2 x number_of_wavelengths numpy array of complex floats
+    _tm : number_of_wavelengths x 2 x 2 numpy array of complex floats
         the transfer matrix for each wavelength
     _kz_array : 1 x number_lf_layers x number_of_wavelengths numpy array of complex floats
         the z-component of the wavevector in each layer of the multilayer for each wavelength
@@ -44,12 +133,6 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         the wavevector magnitude in the incident layer for each wavelength
     _kx_array : 1 x number_of_wavelengths numpy array of floats
         the x-component of the wavevector for each wavelength (conserved throughout layers)
-    _pm : 2 x 2 x (number_of_layers-2) x number_of_wavelengths numpy array of complex floats
-        the P matrix for each of the finite-thickness layers for each wavelength
-    _dm : 2 x 2 x number_of_layers x number_of_wavelengths numpy array of complex floats
-        the D matrix for each of the layers for each wavelength
-    _dim : 2 x 2 x number_of_layers x number_of_wavelengts numpy array of complex floats
-        the inverse of the D matrix for each of the layers for each wavelength
     Returns
     -------
     None
@@ -282,13 +365,11 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
             self.transmissive_window_start = 350e-9
             self.transmissive_window_stop = 700e-9
 
-        self.transmissive_envelope = np.zeros_like(self.wavelength_array)
-        for i in range(self.number_of_wavelengths):
-            if (
-                self.wavelength_array[i] >= self.transmissive_window_start
-                and self.wavelength_array[i] <= self.transmissive_window_stop
-            ):
-                self.transmissive_envelope[i] = 1.0
+        # box function that is 1 inside the transmissive window and 0 outside
+        self.transmissive_envelope = (
+            (self.wavelength_array >= self.transmissive_window_start)
+            & (self.wavelength_array <= self.transmissive_window_stop)
+        ).astype(float)
 
         if "reflective_window_wn" in args:
             lamlist = args["reflective_window_wn"]
@@ -306,13 +387,11 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
             self.reflective_window_start = 10000000 / 2400 * 1e-9
             self.reflective_window_stop = 10000000 / 2000 * 1e-9
 
-        self.reflective_envelope = np.zeros_like(self.wavelength_array)
-        for i in range(self.number_of_wavelengths):
-            if (
-                self.wavelength_array[i] >= self.reflective_window_start
-                and self.wavelength_array[i] <= self.reflective_window_stop
-            ):
-                self.reflective_envelope[i] = 1.0
+        # box function that is 1 inside the reflective window and 0 outside
+        self.reflective_envelope = (
+            (self.wavelength_array >= self.reflective_window_start)
+            & (self.wavelength_array <= self.reflective_window_stop)
+        ).astype(float)
 
         # Retrieve psc thickness for _EQE_spectral_response
         if "psc_thickness_option" in args:
@@ -337,82 +416,22 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
     def set_refractive_index_array(self):
         """once materials are specified, define the refractive_index_array values"""
 
-        # initialize _ri_list based on the number of layers
-        _ri_list = np.ones(self.number_of_layers, dtype=complex)
-
         # initialize the _refractive_index_array with dummy values define the true values later!
-        self._refractive_index_array = np.reshape(
-            np.tile(_ri_list, self.number_of_wavelengths),
-            (self.number_of_wavelengths, self.number_of_layers),
+        # the array is stored column-major so that the refractive index of each layer
+        # is contiguous over wavelength, which is how it is filled and consumed
+        self._refractive_index_array = np.ones(
+            (self.number_of_wavelengths, self.number_of_layers), dtype=complex, order="F"
         )
 
         # terminal layers default to air for now... generalize later!
         self.material_Air(0)
         self.material_Air(self.number_of_layers - 1)
         for i in range(1, self.number_of_layers - 1):
-            # get lower clase version of the material string
-            # to avoid any conflicts with variation in cases
-            # given by the user
-            _lm = self.material_array[i].lower()
-            # keep the original string too in case it is a file name
-            _original_string = self.material_array[i]
-
-            # check all possible values of the material string
-            # and set material as appropriate.
-            # in future probably good to create a single wrapper
-            # function in materials.py that will do this so
-            # that MieDriver and TmmDriver can just use it rather
-            # than duplicating this kind of code in both classes
-            if _lm == "air":
-                self.material_Air(i)
-            elif _lm == "ag":
-                self.material_Ag(i)
-            elif _lm == "al":
-                self.material_Al(i)
-            elif _lm == "al2o3":
-                self.material_Al2O3(i)
-            elif _lm == "al2o3_udm":
-                self.material_Al2O3_UDM(i)
-            elif _lm == "aln":
-                self.material_AlN(i)
-            elif _lm == "au":
-                self.material_Au(i)
-            elif _lm == "hfo2":
-                self.material_HfO2(i)
-            elif _lm == "pb":
-                self.material_Pb(i)
-            elif _lm == "polystyrene":
-                self.material_polystyrene(i)
-            elif _lm == "pt":
-                self.material_Pt(i)
-            elif _lm == "re":
-                self.material_Re(i)
-            elif _lm == "rh":
-                self.material_Rh(i)
-            elif _lm == "ru":
-                self.material_Ru(i)
-            elif _lm == "si":
-                self.material_Si(i)
-            elif _lm == "sio2":
-                self.material_SiO2(i)
-            elif _lm == "sio2_udm":
-                self.material_SiO2_UDM(i)
-            elif _lm == "ta2o5":
-              self.material_Ta2O5(i)
-            elif _lm == "tin":
-                self.material_TiN(i)
-            elif _lm == "tio2":
-                self.material_TiO2(i)
-            elif _lm == "w":
-                self.material_W(i)
-            elif _lm == "zro2":
-                self.material_ZrO2(i)
-            elif _lm == "si3n4":
-                self.material_Si3N4(i)
-            # if we don't match one of these strings, then we assume the user has passed
-            # a filename
-            else:
-                self.material_from_file(i, _original_string)
+            # look the material string up in the materials dictionary;
+            # if we don't match one of the supported materials, then we
+            # assume the user has passed a filename
+            if not self._set_material(i, self.material_array[i]):
+                self.material_from_file(i, self.material_array[i])
 
     def reverse_stack(self):
         """reverse the order of the stack
@@ -440,7 +459,7 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         _temp_ri_array = np.copy(self._refractive_index_array)
         _temp_thickness_array = np.copy(self.thickness_array)
 
-        _new_ri_array = np.zeros((_nwl, _nl - 1), dtype=complex)
+        _new_ri_array = np.zeros((_nwl, _nl - 1), dtype=complex, order="F")
         _new_thickness_array = np.zeros(_nl - 1)
 
         _new_ri_array[:, :layer_number] = _temp_ri_array[:, :layer_number]
@@ -467,7 +486,7 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         _temp_ri_array = np.copy(self._refractive_index_array)
         _temp_thickness_array = np.copy(self.thickness_array)
 
-        _new_ri_array = np.zeros((_nwl, _nl + 1), dtype=complex)
+        _new_ri_array = np.zeros((_nwl, _nl + 1), dtype=complex, order="F")
         _new_thickness_array = np.zeros(_nl + 1)
         _new_air_layer = np.ones(_nwl, dtype=complex) * 1.0
 
@@ -541,48 +560,163 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         self._compute_kx()
         self._compute_kz()
 
-        # compute the reflectivity in a loop for now!
-        self.reflectivity_array = np.zeros_like(self.wavelength_array)
-        self.transmissivity_array = np.zeros_like(self.wavelength_array)
-        self.emissivity_array = np.zeros_like(self.wavelength_array)
+        # get transfer matrix, theta_array, and cos_theta_array for all wavelengths at once
+        _tm, _theta_array, _cos_theta_array = self._compute_tm(
+            self._refractive_index_array,
+            self._k0_array,
+            self._kz_array,
+            self.thickness_array,
+        )
 
-        for i in range(0, self.number_of_wavelengths):
-            _k0 = self._k0_array[i]
-            _ri = self._refractive_index_array[i, :]
-            _kz = self._kz_array[i, :]
+        (
+            self.reflectivity_array,
+            self.transmissivity_array,
+            self.emissivity_array,
+        ) = self._compute_rte(self._refractive_index_array, _tm, _cos_theta_array)
+        # self.render_color("ambient color")
 
-            # get transfer matrix, theta_array, and co_theta_array for current k0 value
-            _tm, _theta_array, _cos_theta_array = self._compute_tm(
-                _ri, _k0, _kz, self.thickness_array
-            )
+    def _compute_rte(self, _ri, _tm, _cos_theta_array):
+        """compute R, T, and epsilon from the transfer matrix
+        Arguments
+        ---------
+        _ri : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _tm : ... x 2 x 2 complex numpy array
+            transfer matrix for each k0 value
+        _cos_theta_array : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each k0 value
+        Returns
+        -------
+        _R : ... numpy array of floats
+            the reflectivity
+        _T : ... numpy array of floats
+            the transmissivity
+        _eps : ... numpy array of floats
+            the absorptivity / emissivity
+        """
+        # reflection amplitude
+        _r = _tm[..., 1, 0] / _tm[..., 0, 0]
 
-            # if self.gradient==True:
-            #    _tmg = self._compute_tm_grad(_ri, _k0, _kz, self.thickness_array)
+        # transmission amplitude
+        _t = 1 / _tm[..., 0, 0]
 
-            # reflection amplitude
-            _r = _tm[1, 0] / _tm[0, 0]
+        # refraction angle and RI prefractor for computing transmission
+        _factor = (
+            _ri[..., self.number_of_layers - 1]
+            * _cos_theta_array[..., self.number_of_layers - 1]
+            / (_ri[..., 0] * _cos_theta_array[..., 0])
+        )
 
-            # transmission amplitude
-            _t = 1 / _tm[0, 0]
+        # reflectivity
+        _R = np.real(_r * np.conj(_r))
 
-            # refraction angle and RI prefractor for computing transmission
-            _factor = (
-                _ri[self.number_of_layers - 1]
-                * _cos_theta_array[self.number_of_layers - 1]
-                / (_ri[0] * _cos_theta_array[0])
-            )
+        # transmissivity
+        _T = np.real(_t * np.conj(_t) * _factor)
 
-            # reflectivity
-            self.reflectivity_array[i] = np.real(_r * np.conj(_r))
+        # emissivity
+        _eps = 1 - _R - _T
 
-            # transmissivity
-            self.transmissivity_array[i] = np.real(_t * np.conj(_t) * _factor)
+        return _R, _T, _eps
 
-            # emissivity
-            self.emissivity_array[i] = (
-                1 - self.reflectivity_array[i] - self.transmissivity_array[i]
+    def _update_layer(self, layer_number, new_thickness):
+        """set the thickness of intermediate layer layer_number to new_thickness and
+        update the spectra without recomputing the rest of the transfer matrix chain;
+        compute_spectrum must have been called for the current structure first
+        Arguments
+        ---------
+        layer_number : int
+            the intermediate layer whose thickness changes
+        new_thickness : float
+            the new thickness of the layer in meters
+        Attributes
+        ----------
+        thickness_array : 1 x number_of_layers numpy array of floats
+            thickness_array[layer_number] is set to new_thickness
+        reflectivity_array : 1 x number_of_wavelengths numpy array of floats
+            the reflectivity spectrum
+        transmissivity_array : 1 x number_of_wavelengths numpy array of floats
+            the transmissivity spectrum
+        emissivity_array : 1 x number_of_wavelengths numpy array of floats
+            the absorptivity / emissivity spectrum
+        Returns
+        -------
+        None
+        Raises
+        ------
+        ValueError
+            if layer_number is not an intermediate layer (1 ... number_of_layers - 2);
+            the terminal media are semi-infinite and have no layer matrix
+        Notes
+        -----
+        The partial products D_0^-1 L_1 ... L_{i-1} and L_{i+1} ... L_{N-2} D_{N-1}
+        to the left and right of layer i do not depend on its thickness, so they are
+        cached on the first call; later calls for the same layer only cost one layer
+        matrix and two 2 x 2 products per wavelength (e.g. finite differences).
+        The cache is rebuilt if a different layer is updated, any other thickness
+        changes, or compute_spectrum has been called again
+        """
+        _nl = self.number_of_layers
+        if not 1 <= layer_number <= _nl - 2:
+            raise ValueError(
+                f"layer_number must be an intermediate layer between 1 and {_nl - 2}, "
+                f"got {layer_number}"
             )
-        # self.render_color("ambient color")
+        _ri = self._refractive_index_array
+        _kz = self._kz_array
+        self.thickness_array[layer_number] = new_thickness
+
+        _cache = getattr(self, "_layer_update_cache", None)
+        _other_layers = np.arange(_nl) != layer_number
+        if (
+            _cache is None
+            or _cache["layer"] != layer_number
+            or _cache["kz"] is not _kz
+            or _cache["polarization"] != self.polarization
+            or not np.array_equal(
+                _cache["thickness"][_other_layers], self.thickness_array[_other_layers]
+            )
+        ):
+            _PHIL = _kz * self.thickness_array
+            _CTHETA, _THETA = self._compute_cos_theta(_ri, self._k0_array, _kz)
+
+            _DM, _left = self._compute_dm(_ri[:, 0], _CTHETA[:, 0])
+            for i in range(1, layer_number):
+                _left = _matmul_2x2(
+                    _left,
+                    self._compute_layer_matrix(_ri[:, i], _CTHETA[:, i], _PHIL[:, i]),
+                )
+
+            _right, _DIM = self._compute_dm(_ri[:, _nl - 1], _CTHETA[:, _nl - 1])
+            for i in range(_nl - 2, layer_number, -1):
+                _right = _matmul_2x2(
+                    self._compute_layer_matrix(_ri[:, i], _CTHETA[:, i], _PHIL[:, i]),
+                    _right,
+                )
+
+            _cache = {
+                "layer": layer_number,
+                "kz": _kz,
+                "polarization": self.polarization,
+                "thickness": np.copy(self.thickness_array),
+                "cos_theta": _CTHETA,
+                "left": _left,
+                "right": _right,
+            }
+            self._layer_update_cache = _cache
+
+        _CTHETA = _cache["cos_theta"]
+        _LM = self._compute_layer_matrix(
+            _ri[:, layer_number],
+            _CTHETA[:, layer_number],
+            _kz[:, layer_number] * new_thickness,
+        )
+        _tm = _matmul_2x2(_matmul_2x2(_cache["left"], _LM), _cache["right"])
+
+        (
+            self.reflectivity_array,
+            self.transmissivity_array,
+            self.emissivity_array,
+        ) = self._compute_rte(_ri, _tm, _CTHETA)
 
     def compute_explicit_angle_spectrum(self):
         """computes the following attributes:
@@ -606,107 +740,49 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         -------
         None
         """
-        # initialize the angle-dependent arrays
-        self.reflectivity_array_s = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-        self.reflectivity_array_p = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-
-        self.transmissivity_array_s = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-        self.transmissivity_array_p = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-
-        self.emissivity_array_s = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-        self.emissivity_array_p = np.zeros(
-            (self.number_of_angles, self.number_of_wavelengths)
-        )
-
         # now set up the angular Gauss-Legendre grid
-        a = 0
-        b = np.pi / 2.0
-        self.x, self.theta_weights = np.polynomial.legendre.leggauss(
-            self.number_of_angles
+        self.x, self.theta_vals, self.theta_weights = _gauss_legendre_grid(
+            self.number_of_angles, 0, np.pi / 2.0
         )
-        self.theta_vals = 0.5 * (self.x + 1) * (b - a) + a
-        self.theta_weights = self.theta_weights * 0.5 * (b - a)
 
         # compute k0 which does not care about angle
         self._compute_k0()
 
-        # loop over angles first
-        for i in range(0, self.number_of_angles):
-            self.incident_angle = self.theta_vals[i]
-            # compute kx and kz, which do depend on angle
-            self._compute_kx()
-            self._compute_kz()
-
-            for j in range(0, self.number_of_wavelengths):
-                _k0 = self._k0_array[j]
-                _ri = self._refractive_index_array[j, :]
-                _kz = self._kz_array[j, :]
-
-                # get transfer matrix, theta_array, and co_theta_array for current k0 value and 's' polarization
-                self.polarization = "s"
-                _tm_s, _theta_array_s, _cos_theta_array_s = self._compute_tm(
-                    _ri, _k0, _kz, self.thickness_array
-                )
-
-                # get transfer matrix, theta_array, and cos_theta_array for current k0 value and 'p' polarization
-                self.polarization = "p"
-                _tm_p, _theta_array_p, _cos_theta_array_p = self._compute_tm(
-                    _ri, _k0, _kz, self.thickness_array
-                )
-
-                # reflection amplitude
-                _r_s = _tm_s[1, 0] / _tm_s[0, 0]
-                _r_p = _tm_p[1, 0] / _tm_p[0, 0]
+        # compute kx and kz for all angles at once; the angles run along a
+        # leading axis of length number_of_angles
+        self.incident_angle = self.theta_vals[:, np.newaxis]
+        self._compute_kx()
+        self._compute_kz()
 
-                # transmission amplitude
-                _t_s = 1 / _tm_s[0, 0]
-                _t_p = 1 / _tm_p[0, 0]
+        # the refractive index does not depend on angle
+        _ri = np.broadcast_to(self._refractive_index_array, np.shape(self._kz_array))
 
-                # refraction angle and RI prefractor for computing transmission
-                _factor_s = (
-                    _ri[self.number_of_layers - 1]
-                    * _cos_theta_array_s[self.number_of_layers - 1]
-                    / (_ri[0] * _cos_theta_array_s[0])
-                )
-                _factor_p = (
-                    _ri[self.number_of_layers - 1]
-                    * _cos_theta_array_p[self.number_of_layers - 1]
-                    / (_ri[0] * _cos_theta_array_p[0])
-                )
-
-                # reflectivity
-                self.reflectivity_array_s[i, j] = np.real(_r_s * np.conj(_r_s))
-                self.reflectivity_array_p[i, j] = np.real(_r_p * np.conj(_r_p))
+        # get transfer matrix, theta_array, and co_theta_array for all angles and k0 values and 's' polarization
+        self.polarization = "s"
+        _tm_s, _theta_array_s, _cos_theta_array_s = self._compute_tm(
+            _ri, self._k0_array, self._kz_array, self.thickness_array
+        )
+        (
+            self.reflectivity_array_s,
+            self.transmissivity_array_s,
+            self.emissivity_array_s,
+        ) = self._compute_rte(_ri, _tm_s, _cos_theta_array_s)
 
-                # transmissivity
-                self.transmissivity_array_s[i, j] = np.real(
-                    _t_s * np.conj(_t_s) * _factor_s
-                )
-                self.transmissivity_array_p[i, j] = np.real(
-                    _t_p * np.conj(_t_p) * _factor_p
-                )
+        # get transfer matrix, theta_array, and cos_theta_array for all angles and k0 values and 'p' polarization
+        self.polarization = "p"
+        _tm_p, _theta_array_p, _cos_theta_array_p = self._compute_tm(
+            _ri, self._k0_array, self._kz_array, self.thickness_array
+        )
+        (
+            self.reflectivity_array_p,
+            self.transmissivity_array_p,
+            self.emissivity_array_p,
+        ) = self._compute_rte(_ri, _tm_p, _cos_theta_array_p)
 
-                # emissivity
-                self.emissivity_array_s[i, j] = (
-                    1
-                    - self.reflectivity_array_s[i, j]
-                    - self.transmissivity_array_s[i, j]
-                )
-                self.emissivity_array_p[i, j] = (
-                    1
-                    - self.reflectivity_array_p[i, j]
-                    - self.transmissivity_array_p[i, j]
-                )
+        # leave the structure at the last angle of the grid
+        self.incident_angle = self.theta_vals[-1]
+        self._compute_kx()
+        self._compute_kz()
 
     def compute_spectrum_gradient(self):
         """computes the following attributes:
@@ -723,67 +799,86 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         None
         """
 
-        # initialize gradient arrays
-        # _nwl -> number of wavelengths
-        _nwl = len(self.wavelength_array)
         # _ngr -> number of gradient dimensions
         _ngr = len(self.gradient_list)
 
-        self.reflectivity_gradient_array = np.zeros((_nwl, _ngr))
-        self.transmissivity_gradient_array = np.zeros((_nwl, _ngr))
-        self.emissivity_gradient_array = np.zeros((_nwl, _ngr))
-
-        for i in range(0, _ngr):
-            for j in range(0, _nwl):
-                _k0 = self._k0_array[j]
-                _ri = self._refractive_index_array[j, :]
-                _kz = self._kz_array[j, :]
+        _ri = self._refractive_index_array
+        _layers = np.arange(1, _ngr + 1)
 
-                # get transfer matrix, theta_array, and co_theta_array for current k0 value
-                _tm, _theta_array, _cos_theta_array = self._compute_tm(
-                    _ri, _k0, _kz, self.thickness_array
-                )
+        # get transfer matrix, its gradient with respect to every layer in the
+        # gradient list, theta_array, and co_theta_array for all k0 values
+        (
+            _tm,
+            _tm_grad,
+            _theta_array,
+            _cos_theta_array,
+        ) = self._compute_tm_and_gradient(
+            _ri, self._k0_array, self._kz_array, self.thickness_array, _layers
+        )
 
-                # get gradient of transfer matrix with respect to layer i
-                _tm_grad, _theta_array, _cos_theta_array = self._compute_tm_gradient(
-                    _ri, _k0, _kz, self.thickness_array, i + 1
-                )
+        (
+            self.reflectivity_gradient_array,
+            self.transmissivity_gradient_array,
+            self.emissivity_gradient_array,
+        ) = self._compute_rte_gradient(_ri, _tm, _tm_grad, _cos_theta_array)
 
-                # Using equation (14) from https://journals.aps.org/prresearch/abstract/10.1103/PhysRevResearch.2.013018
-                # for the derivative of the reflection amplitude for wavelength j with respect to layer i
-                # from wptherml: r_prime = (M11*M21p[j] - M21*M11p[j])/(M11*M11)
-                r_prime = (_tm[0, 0] * _tm_grad[1, 0] - _tm[1, 0] * _tm_grad[0, 0]) / (
-                    _tm[0, 0] ** 2
-                )
-                # using equation (12) to get the reflection amplitude at wavelength j
-                r = _tm[1, 0] / _tm[0, 0]
+    def _compute_rte_gradient(self, _ri, _tm, _tm_grad, _cos_theta_array):
+        """compute the gradient of R, T, and epsilon from the gradient of the transfer matrix
+        Arguments
+        ---------
+        _ri : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _tm : ... x 2 x 2 complex numpy array
+            transfer matrix for each k0 value
+        _tm_grad : ... x len(gradient_list) x 2 x 2 complex numpy array
+            gradient of the transfer matrix with respect to each layer in gradient_list
+        _cos_theta_array : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each k0 value
+        Returns
+        -------
+        _R_prime : ... x len(gradient_list) numpy array of floats
+            gradient of the reflectivity
+        _T_prime : ... x len(gradient_list) numpy array of floats
+            gradient of the transmissivity
+        _eps_prime : ... x len(gradient_list) numpy array of floats
+            gradient of the emissivity
+        """
+        # transfer matrix elements broadcast against the gradient axis
+        _M11 = _tm[..., np.newaxis, 0, 0]
+        _M21 = _tm[..., np.newaxis, 1, 0]
+
+        # using equation (12) to get the reflection amplitude at each wavelength
+        r = _M21 / _M11
+
+        # compute t using equation equation (13)
+        t = 1 / _M11
+
+        _factor = (
+            _ri[..., self.number_of_layers - 1]
+            * _cos_theta_array[..., self.number_of_layers - 1]
+            / (_ri[..., 0] * _cos_theta_array[..., 0])
+        )[..., np.newaxis]
+
+        # Using equation (14) from https://journals.aps.org/prresearch/abstract/10.1103/PhysRevResearch.2.013018
+        # for the derivative of the reflection amplitude at each wavelength with respect to each layer
+        # from wptherml: r_prime = (M11*M21p[j] - M21*M11p[j])/(M11*M11)
+        r_prime = (_M11 * _tm_grad[..., 1, 0] - _M21 * _tm_grad[..., 0, 0]) / (
+            _M11**2
+        )
 
-                # Using equation (10) to get the derivative of R at waveleength j with respect to layer i
-                self.reflectivity_gradient_array[j, i] = np.real(
-                    r_prime * np.conj(r) + r * np.conj(r_prime)
-                )
+        # Using equation (10) to get the derivative of R at each waveleength with respect to each layer
+        _R_prime = np.real(r_prime * np.conj(r) + r * np.conj(r_prime))
 
-                # compute t_prime using equation (15)
-                t_prime = -_tm_grad[0, 0] / _tm[0, 0] ** 2
+        # compute t_prime using equation (15)
+        t_prime = -_tm_grad[..., 0, 0] / _M11**2
 
-                # compute t using equation equation (13)
-                t = 1 / _tm[0, 0]
+        # compute the derivative of T at each wavelength with respect to each layer using Eq. (11)
+        _T_prime = np.real((t_prime * np.conj(t) + t * np.conj(t_prime)) * _factor)
 
-                _factor = (
-                    _ri[self.number_of_layers - 1]
-                    * _cos_theta_array[self.number_of_layers - 1]
-                    / (_ri[0] * _cos_theta_array[0])
-                )
+        # derivative of \epsilon is - \partial R / \partial s -\partial T / \partial s
+        _eps_prime = -_T_prime - _R_prime
 
-                # compute the derivative of T at wavelength j with respect to layer i using Eq. (11)
-                self.transmissivity_gradient_array[j, i] = np.real(
-                    (t_prime * np.conj(t) + t * np.conj(t_prime)) * _factor
-                )
-                # derivative of \epsilon is - \partial R / \partial s -\partial T / \partial sß
-                self.emissivity_gradient_array[j, i] = (
-                    -self.transmissivity_gradient_array[j, i]
-                    - self.reflectivity_gradient_array[j, i]
-                )
+        return _R_prime, _T_prime, _eps_prime
 
     def compute_explicit_angle_spectrum_gradient(self):
         """computes the following attributes:
@@ -811,145 +906,58 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
         -------
         None
         """
-        # initialize gradient arrays
-        # _nwl -> number of wavelengths
-        _nwl = len(self.wavelength_array)
         # _ngr -> number of gradient dimensions
         _ngr = len(self.gradient_list)
-        # _nth -> number of angles
-        _nth = self.number_of_angles
+        _layers = np.arange(1, _ngr + 1)
 
-        # jjf note - _nwl is going to be the longest axis in most cases
-        # should it be either the inner-most or outter-most dimension instead for
-        # performance reasons?
-        self.reflectivity_gradient_array_s = np.zeros((_nth, _nwl, _ngr))
-        self.reflectivity_gradient_array_p = np.zeros((_nth, _nwl, _ngr))
+        # compute k0 which does not care about angle
+        self._compute_k0()
 
-        self.transmissivity_gradient_array_s = np.zeros((_nth, _nwl, _ngr))
-        self.transmissivity_gradient_array_p = np.zeros((_nth, _nwl, _ngr))
+        # compute kx and kz for all angles at once; the angles run along a
+        # leading axis of length number_of_angles
+        self.incident_angle = self.theta_vals[:, np.newaxis]
+        self._compute_kx()
+        self._compute_kz()
 
-        self.emissivity_gradient_array_s = np.zeros((_nth, _nwl, _ngr))
-        self.emissivity_gradient_array_p = np.zeros((_nth, _nwl, _ngr))
+        # the refractive index does not depend on angle
+        _ri = np.broadcast_to(self._refractive_index_array, np.shape(self._kz_array))
+        _k0 = self._k0_array
+        _kz = self._kz_array
 
-        # compute k0 which does not care about angle
-        self._compute_k0()
+        # s-polarization first
+        self.polarization = "s"
+        # get transfer matrix and its gradient with respect to every layer
+        (
+            _tm_s,
+            _tm_grad_s,
+            _theta_array,
+            _cos_theta_array_s,
+        ) = self._compute_tm_and_gradient(_ri, _k0, _kz, self.thickness_array, _layers)
+        (
+            self.reflectivity_gradient_array_s,
+            self.transmissivity_gradient_array_s,
+            self.emissivity_gradient_array_s,
+        ) = self._compute_rte_gradient(_ri, _tm_s, _tm_grad_s, _cos_theta_array_s)
 
-        # loop over angles first
-        for k in range(0, _nth):
-            self.incident_angle = self.theta_vals[k]
-            # compute kx and kz, which do depend on angle
-            self._compute_kx()
-            self._compute_kz()
-
-            for i in range(0, _ngr):
-                for j in range(0, _nwl):
-                    _k0 = self._k0_array[j]
-                    _ri = self._refractive_index_array[j, :]
-                    _kz = self._kz_array[j, :]
-
-                    # s-polarization first
-                    self.polarization = "s"
-                    # get transfer matrix, theta_array, and co_theta_array for current k0 value
-                    _tm, _theta_array, _cos_theta_array = self._compute_tm(
-                        _ri, _k0, _kz, self.thickness_array
-                    )
-
-                    # get gradient of transfer matrix with respect to layer i
-                    (
-                        _tm_grad,
-                        _theta_array,
-                        _cos_theta_array,
-                    ) = self._compute_tm_gradient(
-                        _ri, _k0, _kz, self.thickness_array, i + 1
-                    )
-
-                    # Using equation (14) from https://journals.aps.org/prresearch/abstract/10.1103/PhysRevResearch.2.013018
-                    # for the derivative of the reflection amplitude for wavelength j with respect to layer i
-                    # from wptherml: r_prime = (M11*M21p[j] - M21*M11p[j])/(M11*M11)
-                    r_prime = (
-                        _tm[0, 0] * _tm_grad[1, 0] - _tm[1, 0] * _tm_grad[0, 0]
-                    ) / (_tm[0, 0] ** 2)
-                    # using equation (12) to get the reflection amplitude at wavelength j
-                    r = _tm[1, 0] / _tm[0, 0]
-
-                    # Using equation (10) to get the derivative of R at waveleength j with respect to layer i
-                    self.reflectivity_gradient_array_s[k, j, i] = np.real(
-                        r_prime * np.conj(r) + r * np.conj(r_prime)
-                    )
-
-                    # compute t_prime using equation (15)
-                    t_prime = -_tm_grad[0, 0] / _tm[0, 0] ** 2
-
-                    # compute t using equation equation (13)
-                    t = 1 / _tm[0, 0]
-
-                    _factor = (
-                        _ri[self.number_of_layers - 1]
-                        * _cos_theta_array[self.number_of_layers - 1]
-                        / (_ri[0] * _cos_theta_array[0])
-                    )
-
-                    # compute the derivative of T at wavelength j with respect to layer i using Eq. (11)
-                    self.transmissivity_gradient_array_s[k, j, i] = np.real(
-                        (t_prime * np.conj(t) + t * np.conj(t_prime)) * _factor
-                    )
-                    # derivative of \epsilon is - \partial R / \partial s -\partial T / \partial sß
-                    self.emissivity_gradient_array_s[k, j, i] = (
-                        -self.transmissivity_gradient_array_s[k, j, i]
-                        - self.reflectivity_gradient_array_s[k, j, i]
-                    )
-
-                    # p-polarization second
-                    self.polarization = "p"
-                    # get transfer matrix, theta_array, and co_theta_array for current k0 value
-                    _tm, _theta_array, _cos_theta_array = self._compute_tm(
-                        _ri, _k0, _kz, self.thickness_array
-                    )
-
-                    # get gradient of transfer matrix with respect to layer i
-                    (
-                        _tm_grad,
-                        _theta_array,
-                        _cos_theta_array,
-                    ) = self._compute_tm_gradient(
-                        _ri, _k0, _kz, self.thickness_array, i + 1
-                    )
-
-                    # Using equation (14) from https://journals.aps.org/prresearch/abstract/10.1103/PhysRevResearch.2.013018
-                    # for the derivative of the reflection amplitude for wavelength j with respect to layer i
-                    # from wptherml: r_prime = (M11*M21p[j] - M21*M11p[j])/(M11*M11)
-                    r_prime = (
-                        _tm[0, 0] * _tm_grad[1, 0] - _tm[1, 0] * _tm_grad[0, 0]
-                    ) / (_tm[0, 0] ** 2)
-                    # using equation (12) to get the reflection amplitude at wavelength j
-                    r = _tm[1, 0] / _tm[0, 0]
-
-                    # Using equation (10) to get the derivative of R at waveleength j with respect to layer i
-                    self.reflectivity_gradient_array_p[k, j, i] = np.real(
-                        r_prime * np.conj(r) + r * np.conj(r_prime)
-                    )
-
-                    # compute t_prime using equation (15)
-                    t_prime = -_tm_grad[0, 0] / _tm[0, 0] ** 2
-
-                    # compute t using equation equation (13)
-                    t = 1 / _tm[0, 0]
-
-                    _factor = (
-                        _ri[self.number_of_layers - 1]
-                        * _cos_theta_array[self.number_of_layers - 1]
-                        / (_ri[0] * _cos_theta_array[0])
-                    )
-
-                    # compute the derivative of T at wavelength j with respect to layer i using Eq. (11)
-                    self.transmissivity_gradient_array_p[k, j, i] = np.real(
-                        (t_prime * np.conj(t) + t * np.conj(t_prime)) * _factor
-                    )
-                    # derivative of \epsilon is - \partial R / \partial s -\partial T / \partial sß
-                    self.emissivity_gradient_array_p[k, j, i] = (
-                        -self.transmissivity_gradient_array_p[k, j, i]
-                        - self.reflectivity_gradient_array_p[k, j, i]
-                    )
+        # p-polarization second
+        self.polarization = "p"
+        # get transfer matrix and its gradient with respect to every layer
+        (
+            _tm_p,
+            _tm_grad_p,
+            _theta_array,
+            _cos_theta_array_p,
+        ) = self._compute_tm_and_gradient(_ri, _k0, _kz, self.thickness_array, _layers)
+        (
+            self.reflectivity_gradient_array_p,
+            self.transmissivity_gradient_array_p,
+            self.emissivity_gradient_array_p,
+        ) = self._compute_rte_gradient(_ri, _tm_p, _tm_grad_p, _cos_theta_array_p)
+
+        # leave the structure at the last angle of the grid
+        self.incident_angle = self.theta_vals[-1]
+        self._compute_kx()
+        self._compute_kz()
 
     def compute_stpv(self):
         """compute the figures of merit for STPV applications, including"""
@@ -1327,9 +1335,14 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
             _k0_array : 1 x number_of_wavelengths numpy array of floats
                 the wavevector magnitude in the incident layer for each wavelength
         """
+        # at normal incidence kx = 0 and kz = n k0 in every layer
+        if np.all(self.incident_angle == 0):
+            self._kz_array = self._refractive_index_array * self._k0_array[:, np.newaxis]
+            return
+
         self._kz_array = np.sqrt(
             (self._refractive_index_array * self._k0_array[:, np.newaxis]) ** 2
-            - self._kx_array[:, np.newaxis] ** 2
+            - self._kx_array[..., np.newaxis] ** 2
         )
 
     def _compute_k0(self):
@@ -1341,150 +1354,461 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
             _k0_array : 1 x number of wavelengths float
                 the wavenumbers that will illuminate the structure in SI units
         """
-        self._k0_array = np.pi * 2 / self.wavelength_array
+        # k0 only depends on wavelength_array, so it is computed once per wavelength_array
+        _cache = self._get_spectrum_cache()
+        if "k0" not in _cache:
+            _k0 = np.pi * 2 / self.wavelength_array
+            _k0.setflags(write=False)
+            _cache["k0"] = _k0
+        self._k0_array = _cache["k0"]
 
     def _compute_kx(self):
         """computes the _kx_array
         Attributes
         ----------
-            _refractive_index_array : number_of_layers x number_of_wavelengths numpy array of complex floats
+            _refractive_index_array : number_of_wavelengths x number_of_layers numpy array of complex floats
                 the array of refractive index values corresponding to wavelength_array
-            incident_angle : float
-                the angle of incidence of light illuminating the structure
+            incident_angle : float or number_of_angles x 1 numpy array of floats
+                the angle of incidence of light illuminating the structure; an array
+                of angles adds a leading angle axis to _kx_array and _kz_array
             _kx_array : 1 x number_of_wavelengths numpy array of complex floats
                 the x-component of the wavevector in each layer for each wavelength
+                (number_of_angles x number_of_wavelengths for an array of angles)
             _k0_array : 1 x number_of_wavelengths numpy array of floats
                 the wavevector magnitude in the incident layer for each wavelengthhe wavenumbers that will illuminate the structure in SI units
+            _sin_theta0 : float or number_of_angles x 1 numpy array of floats
+                sine of the incident angle
+            _cos_theta0 : float or number_of_angles x 1 numpy array of floats
+                cosine of the incident angle, used in the incident layer by _compute_tm
         """
+        # the trig functions of the incident angle only change when
+        # incident_angle does, so evaluate them once here
+        self._sin_theta0 = np.sin(self.incident_angle)
+        self._cos_theta0 = np.cos(self.incident_angle)
+
         # compute kx_array
         self._kx_array = (
-            self._refractive_index_array[:, 0]
-            * np.sin(self.incident_angle)
-            * self._k0_array
+            self._refractive_index_array[:, 0] * self._sin_theta0 * self._k0_array
         )
 
     def _compute_tm_gradient(self, _refractive_index, _k0, _kz, _d, _ln):
-        """compute the transfer matrix for each wavelength
+        """compute the gradient of the transfer matrix with respect to the thickness of layer _ln
+        for all wavelengths at once
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _k0 : ... numpy array of floats
+            the k0 values
+        _kz : ... x number_of_layers numpy array of complex floats
+            the z-component of the wavevector in each layer for each k0 value
+        _d : 1 x number_of_layers numpy array of floats
+            the thickness of each layer
         _ln : int
             specifies the layer number the gradient will be taken with respect to
         Returns
         -------
-        _tm_gradient : 2 x 2 complex numpy array
-            transfer matrix for the _k0 value
-        _THETA : 1 x number_of_layers complex numpy array
-            refraction angles in each layer for the _k0 value
-        _CTHETA : 1 x number_of_layers complex numpy array
-            cosine of the refraction angles in each layer for the _k0 value
+        _tm_gradient : ... x 2 x 2 complex numpy array
+            gradient of the transfer matrix for each _k0 value
+        _THETA : ... x number_of_layers complex numpy array
+            refraction angles in each layer for each _k0 value
+        _CTHETA : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each _k0 value
         JJF Note: Basically the only difference between the calculation
         of the dM/dS_ln and M is that a single P matrix corresponding
-        to _ln is replaced by dP/DP_ln.  So, you can basically modify the
-        loop where _PM is computed to have a conditional that
-        computes _PM by calling _compute_pm_gradient instead of _compute_pm
-        when i == _ln
+        to _ln is replaced by dP/DP_ln.  With the D P D^-1 product of each
+        layer fused into a single layer matrix, this means the layer matrix
+        of _ln is replaced by its derivative with respect to thickness
         """
-
-        _DM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _DIM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _PM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _CTHETA = np.zeros(self.number_of_layers, dtype=complex)
-        _THETA = np.zeros(self.number_of_layers, dtype=complex)
-
         _PHIL = _kz * _d
-        _THETA[0] = self.incident_angle
-        _CTHETA[0] = np.cos(self.incident_angle)
+        _CTHETA, _THETA = self._compute_cos_theta(_refractive_index, _k0, _kz)
 
-        _CTHETA[1 : self.number_of_layers] = _kz[1 : self.number_of_layers] / (
-            _refractive_index[1 : self.number_of_layers] * _k0
-        )
-        _THETA[1 : self.number_of_layers] = np.arccos(
-            _CTHETA[1 : self.number_of_layers]
-        )
         # initialize _tm_gradient here!  (was previously _tm)
-        _DM[:, :, 0], _tm_gradient = self._compute_dm(_refractive_index[0], _CTHETA[0])
+        _DM, _tm_gradient = self._compute_dm(_refractive_index[..., 0], _CTHETA[..., 0])
 
         for i in range(1, self.number_of_layers - 1):
-            _DM[:, :, i], _DIM[:, :, i] = self._compute_dm(
-                _refractive_index[i], _CTHETA[i]
-            )
             if i == _ln:
-                _PM[:, :, i] = self._compute_pm_analytical_gradient(_kz[i], _PHIL[i])
+                _LM = self._compute_layer_matrix_analytical_gradient(
+                    _refractive_index[..., i], _CTHETA[..., i], _kz[..., i], _PHIL[..., i]
+                )
             else:
-                _PM[:, :, i] = self._compute_pm(_PHIL[i])
+                _LM = self._compute_layer_matrix(
+                    _refractive_index[..., i], _CTHETA[..., i], _PHIL[..., i]
+                )
 
-            _tm_gradient = np.matmul(_tm_gradient, _DM[:, :, i])
-            _tm_gradient = np.matmul(_tm_gradient, _PM[:, :, i])
-            _tm_gradient = np.matmul(_tm_gradient, _DIM[:, :, i])
+            _tm_gradient = _matmul_2x2(_tm_gradient, _LM)
 
-        (
-            _DM[:, :, self.number_of_layers - 1],
-            _DIM[:, :, self.number_of_layers - 1],
-        ) = self._compute_dm(
-            _refractive_index[self.number_of_layers - 1],
-            _CTHETA[self.number_of_layers - 1],
+        _DM, _DIM = self._compute_dm(
+            _refractive_index[..., self.number_of_layers - 1],
+            _CTHETA[..., self.number_of_layers - 1],
         )
 
-        _tm_gradient = np.matmul(_tm_gradient, _DM[:, :, self.number_of_layers - 1])
+        _tm_gradient = _matmul_2x2(_tm_gradient, _DM)
 
         return _tm_gradient, _THETA, _CTHETA
 
-    def _compute_tm(self, _refractive_index, _k0, _kz, _d):
-        """compute the transfer matrix for each wavelength
+    def _compute_tm_and_gradient(self, _refractive_index, _k0, _kz, _d, _layer_list):
+        """compute the transfer matrix and its gradient with respect to the thickness
+        of every layer in _layer_list for all wavelengths at once
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _k0 : ... numpy array of floats
+            the k0 values
+        _kz : ... x number_of_layers numpy array of complex floats
+            the z-component of the wavevector in each layer for each k0 value
+        _d : 1 x number_of_layers numpy array of floats
+            the thickness of each layer
+        _layer_list : 1 x len(gradient_list) array of ints
+            the layer numbers the gradient will be taken with respect to
         Returns
         -------
-        _tm : 2 x 2 complex numpy array
-            transfer matrix for the _k0 value
-        _THETA : 1 x number_of_layers complex numpy array
-            refraction angles in each layer for the _k0 value
-        _CTHETA : 1 x number_of_layers complex numpy array
-            cosine of the refraction angles in each layer for the _k0 value
+        _tm : ... x 2 x 2 complex numpy array
+            transfer matrix for each _k0 value
+        _tm_gradient : ... x len(_layer_list) x 2 x 2 complex numpy array
+            gradient of the transfer matrix with respect to each layer in _layer_list
+        _THETA : ... x number_of_layers complex numpy array
+            refraction angles in each layer for each _k0 value
+        _CTHETA : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each _k0 value
+        Notes
+        -----
+        The transfer matrix is M = D_0^-1 L_1 L_2 ... L_{N-2} D_{N-1}, and dM/ds_l only
+        replaces L_l by dL_l/ds_l.  Storing the partial products to the left and to
+        the right of each layer from one forward and one backward sweep gives
+        dM/ds_l = left_l dL_l/ds_l right_l for every l, so the full gradient costs
+        about three transfer matrix evaluations instead of one per layer.
+        When only a few layers are requested, the partial products are not stored
+        and the gradient is instead propagated forward by _compute_tm_jvp
         """
-        _DM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _DIM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _PM = np.zeros((2, 2, self.number_of_layers), dtype=complex)
-        _CTHETA = np.zeros(self.number_of_layers, dtype=complex)
-        _THETA = np.zeros(self.number_of_layers, dtype=complex)
+        _nl = self.number_of_layers
+
+        # forward mode carries one tangent per requested layer while reverse mode
+        # stores two partial products per layer; for a short gradient list the
+        # forward pass is cheaper in both memory and matrix products
+        if len(_layer_list) <= 2:
+            _tangents = np.zeros((len(_layer_list), _nl))
+            _tangents[np.arange(len(_layer_list)), _layer_list] = 1.0
+            return self._compute_tm_jvp(_refractive_index, _k0, _kz, _d, _tangents)
 
         _PHIL = _kz * _d
-        _THETA[0] = self.incident_angle
-        _CTHETA[0] = np.cos(self.incident_angle)
+        _CTHETA, _THETA = self._compute_cos_theta(_refractive_index, _k0, _kz)
 
-        _CTHETA[1 : self.number_of_layers] = _kz[1 : self.number_of_layers] / (
-            _refractive_index[1 : self.number_of_layers] * _k0
+        _DM, _DIM = self._compute_dm(_refractive_index[..., 0], _CTHETA[..., 0])
+        _DM_last, _DIM_last = self._compute_dm(
+            _refractive_index[..., _nl - 1], _CTHETA[..., _nl - 1]
         )
-        _THETA[1 : self.number_of_layers] = np.arccos(
-            _CTHETA[1 : self.number_of_layers]
+
+        # layer-major matrices of all intermediate layers; layer i is _LM[i - 1]
+        _LM = self._compute_intermediate_layer_matrices(
+            _refractive_index, _CTHETA, _PHIL
         )
 
-        _DM[:, :, 0], _tm = self._compute_dm(_refractive_index[0], _CTHETA[0])
+        # forward sweep: _left[i] = D_0^-1 L_1 ... L_{i-1}
+        _left = np.empty((_nl,) + np.shape(_DIM), dtype=complex)
+        _left[1] = _DIM
+        for i in range(2, _nl):
+            _matmul_2x2(_left[i - 1], _LM[i - 2], out=_left[i])
+
+        _tm = _matmul_2x2(_left[_nl - 1], _DM_last)
+
+        # backward sweep: _right[i] = L_{i+1} ... L_{N-2} D_{N-1}
+        _right = np.empty((_nl,) + np.shape(_DM_last), dtype=complex)
+        _right[_nl - 2] = _DM_last
+        for i in range(_nl - 3, 0, -1):
+            _matmul_2x2(_LM[i], _right[i + 1], out=_right[i])
+
+        # derivatives of every requested layer matrix from one vectorized call
+        _dLM = self._compute_layer_matrix_analytical_gradient(
+            _refractive_index[..., _layer_list],
+            _CTHETA[..., _layer_list],
+            _kz[..., _layer_list],
+            _PHIL[..., _layer_list],
+        )
 
-        for i in range(1, self.number_of_layers - 1):
-            _DM[:, :, i], _DIM[:, :, i] = self._compute_dm(
-                _refractive_index[i], _CTHETA[i]
+        _tm_gradient = np.empty(
+            np.shape(_tm)[:-2] + (len(_layer_list), 2, 2), dtype=complex
+        )
+        for j, _ln in enumerate(_layer_list):
+            _matmul_2x2(
+                _matmul_2x2(_left[_ln], _dLM[..., j, :, :]),
+                _right[_ln],
+                out=_tm_gradient[..., j, :, :],
             )
-            _PM[:, :, i] = self._compute_pm(_PHIL[i])
-            _tm = np.matmul(_tm, _DM[:, :, i])
-            _tm = np.matmul(_tm, _PM[:, :, i])
-            _tm = np.matmul(_tm, _DIM[:, :, i])
 
-        (
-            _DM[:, :, self.number_of_layers - 1],
-            _DIM[:, :, self.number_of_layers - 1],
-        ) = self._compute_dm(
-            _refractive_index[self.number_of_layers - 1],
-            _CTHETA[self.number_of_layers - 1],
+        return _tm, _tm_gradient, _THETA, _CTHETA
+
+    def _compute_tm_jvp(self, _refractive_index, _k0, _kz, _d, _tangents):
+        """compute the transfer matrix and its directional derivatives along the
+        thickness directions in _tangents with a single forward pass
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _k0 : ... numpy array of floats
+            the k0 values
+        _kz : ... x number_of_layers numpy array of complex floats
+            the z-component of the wavevector in each layer for each k0 value
+        _d : 1 x number_of_layers numpy array of floats
+            the thickness of each layer
+        _tangents : number_of_directions x number_of_layers numpy array of floats
+            each row is a direction in thickness space; one-hot rows give the
+            gradient with respect to a single layer
+        Returns
+        -------
+        _tm : ... x 2 x 2 complex numpy array
+            transfer matrix for each _k0 value
+        _tm_jvp : ... x number_of_directions x 2 x 2 complex numpy array
+            derivative of the transfer matrix along each direction in _tangents
+        _THETA : ... x number_of_layers complex numpy array
+            refraction angles in each layer for each _k0 value
+        _CTHETA : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each _k0 value
+        Notes
+        -----
+        The pair (M, dM) is propagated through the chain with the product rule
+        (A, dA) (B, dB) = (AB, dA B + A dB), so no partial products are stored
+        """
+        _nl = self.number_of_layers
+        _tangents = np.asarray(_tangents, dtype=float)
+        _PHIL = _kz * _d
+        _CTHETA, _THETA = self._compute_cos_theta(_refractive_index, _k0, _kz)
+
+        _DM, _tm = self._compute_dm(_refractive_index[..., 0], _CTHETA[..., 0])
+        _tm_jvp = np.zeros(
+            np.shape(_tm)[:-2] + (_tangents.shape[0], 2, 2), dtype=complex
+        )
+
+        # layer-major matrices of all intermediate layers; layer i is _LM[i - 1]
+        _LM = self._compute_intermediate_layer_matrices(
+            _refractive_index, _CTHETA, _PHIL
+        )
+        _buf = np.empty_like(_tm)
+        _buf_jvp = np.empty_like(_tm_jvp)
+
+        for i in range(1, _nl - 1):
+            _L = _LM[i - 1]
+            _matmul_2x2(_tm_jvp, _L[..., np.newaxis, :, :], out=_buf_jvp)
+            _tm_jvp, _buf_jvp = _buf_jvp, _tm_jvp
+
+            # only layers with a non-zero tangent component contribute dL / ds
+            if np.any(_tangents[:, i]):
+                _dL = self._compute_layer_matrix_analytical_gradient(
+                    _refractive_index[..., i],
+                    _CTHETA[..., i],
+                    _kz[..., i],
+                    _PHIL[..., i],
+                )
+                _tm_jvp += (
+                    _tangents[:, i, np.newaxis, np.newaxis]
+                    * _matmul_2x2(_tm, _dL)[..., np.newaxis, :, :]
+                )
+
+            _matmul_2x2(_tm, _L, out=_buf)
+            _tm, _buf = _buf, _tm
+
+        _DM, _DIM = self._compute_dm(
+            _refractive_index[..., _nl - 1], _CTHETA[..., _nl - 1]
+        )
+        _tm = _matmul_2x2(_tm, _DM)
+        _tm_jvp = _matmul_2x2(_tm_jvp, _DM[..., np.newaxis, :, :])
+
+        return _tm, _tm_jvp, _THETA, _CTHETA
+
+    def _compute_tm(self, _refractive_index, _k0, _kz, _d):
+        """compute the transfer matrix for all wavelengths at once
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _k0 : ... numpy array of floats
+            the k0 values
+        _kz : ... x number_of_layers numpy array of complex floats
+            the z-component of the wavevector in each layer for each k0 value
+        _d : 1 x number_of_layers numpy array of floats
+            the thickness of each layer
+        Returns
+        -------
+        _tm : ... x 2 x 2 complex numpy array
+            transfer matrix for each _k0 value
+        _THETA : ... x number_of_layers complex numpy array
+            refraction angles in each layer for each _k0 value
+        _CTHETA : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each _k0 value
+        """
+        _PHIL = _kz * _d
+        _CTHETA, _THETA = self._compute_cos_theta(_refractive_index, _k0, _kz)
+
+        _DM, _tm = self._compute_dm(_refractive_index[..., 0], _CTHETA[..., 0])
+
+        # layers with the same refractive index and thickness share a label, and
+        # only one layer matrix is built per label; layer i is _LM[_labels[i - 1]]
+        _nl = self.number_of_layers
+        _labels, _unique_layers = self._label_intermediate_layers(_refractive_index, _d)
+        _LM = self._compute_intermediate_layer_matrices(
+            _refractive_index, _CTHETA, _PHIL, _unique_layers
         )
 
-        _tm = np.matmul(_tm, _DM[:, :, self.number_of_layers - 1])
+        # the chain is multiplied into two preallocated buffers that swap roles,
+        # so no temporaries are created per layer.  A period repeated _repeats
+        # times (e.g. the bilayers of a Bragg mirror) is built once and raised
+        # to the _repeats power by repeated squaring
+        _buf = np.empty_like(_tm)
+        for _start, _period, _repeats in self._periodic_runs_from_labels(_labels):
+            if _repeats == 1:
+                for i in range(_start, _start + _period):
+                    _matmul_2x2(_tm, _LM[_labels[i - 1]], out=_buf)
+                    _tm, _buf = _buf, _tm
+                continue
+
+            _PM = _LM[_labels[_start - 1]]
+            for i in range(_start + 1, _start + _period):
+                _PM = _matmul_2x2(_PM, _LM[_labels[i - 1]])
+            _PM = np.linalg.matrix_power(_PM, _repeats)
+
+            _matmul_2x2(_tm, _PM, out=_buf)
+            _tm, _buf = _buf, _tm
+
+        _DM, _DIM = self._compute_dm(
+            _refractive_index[..., _nl - 1],
+            _CTHETA[..., _nl - 1],
+        )
+
+        _tm = _matmul_2x2(_tm, _DM)
 
         return _tm, _THETA, _CTHETA
 
+    def _label_intermediate_layers(self, _refractive_index, _d):
+        """label the intermediate layers 1 ... number_of_layers - 2 so that layers
+        with the same refractive index and thickness share a label
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _d : 1 x number_of_layers numpy array of floats
+            the thickness of each layer
+        Returns
+        -------
+        _labels : tuple of ints
+            the label of each intermediate layer; _labels[i - 1] belongs to layer i
+        _unique_layers : list of ints
+            the first layer carrying each label, so _unique_layers[_labels[i - 1]]
+            has the same layer matrix as layer i
+        """
+        _nl = self.number_of_layers
+
+        # hash each layer's thickness and refractive index column rather than
+        # comparing columns pairwise; _refractive_index_array is column-contiguous
+        # (each layer's wavelength column is contiguous), so no copy is made here
+        _layer_ri = np.ascontiguousarray(np.moveaxis(_refractive_index, -1, 0))
+        _label_of = {}
+        _labels = []
+        _unique_layers = []
+        for i in range(1, _nl - 1):
+            _key = (_d[i], _layer_ri[i].tobytes())
+            if _key not in _label_of:
+                _label_of[_key] = len(_unique_layers)
+                _unique_layers.append(i)
+            _labels.append(_label_of[_key])
+
+        return tuple(_labels), _unique_layers
+
+    def _periodic_runs_from_labels(self, _labels):
+        """split the intermediate layers 1 ... number_of_layers - 2 into runs of
+        a repeated period of layers
+        Arguments
+        ---------
+        _labels : tuple of ints
+            the label of each intermediate layer from _label_intermediate_layers
+        Returns
+        -------
+        _runs : list of (int, int, int) tuples
+            (first layer, number of layers in the period, number of repeats) for
+            each run; the runs are contiguous and cover every intermediate layer,
+            and a layer that does not repeat is a run with period 1 and 1 repeat
+        Notes
+        -----
+        The runs only depend on the labels, so the last result is kept in
+        _periodic_runs_cache and reused while the structure is unchanged (e.g. for
+        both polarizations or repeated spectra); any change to thickness_array or
+        _refractive_index_array that alters which layers repeat changes the labels
+        """
+        _cache = getattr(self, "_periodic_runs_cache", None)
+        if _cache is not None and _cache[0] == _labels:
+            return _cache[1]
+
+        _n = len(_labels)
+        if len(set(_labels)) == _n:
+            # no label appears twice, so nothing can repeat
+            _runs = [(i, 1, 1) for i in range(1, _n + 1)]
+        else:
+            # greedily take the period at each position that removes the most layers
+            _runs = []
+            i = 0
+            while i < _n:
+                _best_period, _best_repeats = 1, 1
+                for _period in range(1, (_n - i) // 2 + 1):
+                    _repeats = 1
+                    while (
+                        i + (_repeats + 1) * _period <= _n
+                        and _labels[i : i + _period]
+                        == _labels[i + _repeats * _period : i + (_repeats + 1) * _period]
+                    ):
+                        _repeats += 1
+                    if _period * (_repeats - 1) > _best_period * (_best_repeats - 1):
+                        _best_period, _best_repeats = _period, _repeats
+                _runs.append((i + 1, _best_period, _best_repeats))
+                i += _best_period * _best_repeats
+
+        self._periodic_runs_cache = (_labels, _runs)
+        return _runs
+
+    def _compute_cos_theta(self, _refractive_index, _k0, _kz):
+        """compute the cosine of the refraction angle and the refraction angle
+        in each layer from Snell's law
+        Arguments
+        ---------
+        _refractive_index : ... x number_of_layers numpy array of complex floats
+            refractive index of each layer for each k0 value
+        _k0 : ... numpy array of floats
+            the k0 values
+        _kz : ... x number_of_layers numpy array of complex floats
+            the z-component of the wavevector in each layer for each k0 value
+        Returns
+        -------
+        _CTHETA : ... x number_of_layers complex numpy array
+            cosine of the refraction angles in each layer for each _k0 value
+        _THETA : ... x number_of_layers complex numpy array
+            refraction angles in each layer for each _k0 value
+        """
+        # at normal incidence there is no refraction: cos(theta) = 1 and theta = 0
+        # in every layer, so Snell's law and the arccos can be skipped
+        if np.all(self.incident_angle == 0):
+            return (
+                np.ones(np.shape(_kz), dtype=complex),
+                np.zeros(np.shape(_kz), dtype=complex),
+            )
+
+        _CTHETA = np.zeros(np.shape(_kz), dtype=complex)
+        _CTHETA[..., 0] = self._cos_theta0
+        _CTHETA[..., 1:] = _kz[..., 1:] / (
+            _refractive_index[..., 1:] * np.asarray(_k0)[..., np.newaxis]
+        )
+
+        _THETA = np.zeros(np.shape(_kz), dtype=complex)
+        _THETA[..., 0] = self.incident_angle
+        _THETA[..., 1:] = np.arccos(_CTHETA[..., 1:])
+
+        return _CTHETA, _THETA
+
     def _compute_dm(self, refractive_index, cosine_theta):
         """compute the D and D_inv matrices for each layer and wavelength
         Arguments
         ---------
-            refractive_index : complex float
+            refractive_index : complex float or numpy array of complex floats
                 refractive index of the layer you are computing _dm and _dim for
-            cosine_theta : complex float
+            cosine_theta : complex float or numpy array of complex floats
                 cosine of the complex refraction angle within the layer you are computing _dm and _dim for
         Attributes
         ----------
@@ -1492,84 +1816,192 @@ class TmmDriver(SpectrumDriver, Materials, Therml):
                 string indicating the polarization convention of the incident light
         Returns
         -------
-        _dm, _dim
+        _dm, _dim : ... x 2 x 2 numpy arrays of complex floats
         """
-
-        _dm = np.zeros((2, 2), dtype=complex)
-        _dim = np.zeros((2, 2), dtype=complex)
+        _shape = np.broadcast(refractive_index, cosine_theta).shape + (2, 2)
+        _dm = np.zeros(_shape, dtype=complex)
+        _dim = np.empty(_shape, dtype=complex)
 
         if self.polarization == "s":
-            _dm[0, 0] = 1 + 0j
-            _dm[0, 1] = 1 + 0j
-            _dm[1, 0] = refractive_index * cosine_theta
-            _dm[1, 1] = -1 * refractive_index * cosine_theta
+            _dm[..., 0, 0] = 1 + 0j
+            _dm[..., 0, 1] = 1 + 0j
+            _dm[..., 1, 0] = refractive_index * cosine_theta
+            _dm[..., 1, 1] = -1 * refractive_index * cosine_theta
 
         elif self.polarization == "p":
-            _dm[0, 0] = cosine_theta + 0j
-            _dm[0, 1] = cosine_theta + 0j
-            _dm[1, 0] = refractive_index
-            _dm[1, 1] = -1 * refractive_index
+            _dm[..., 0, 0] = cosine_theta + 0j
+            _dm[..., 0, 1] = cosine_theta + 0j
+            _dm[..., 1, 0] = refractive_index
+            _dm[..., 1, 1] = -1 * refractive_index
 
         # Note it is actually faster to invert the 2x2 matrix
         # "By Hand" than it is to use linalg.inv
         # and this inv step seems to be the bottleneck for the TMM function
         # but numpy way would just look like this:
         # _dim = inv(_dm)
-        _tmp = _dm[0, 0] * _dm[1, 1] - _dm[0, 1] * _dm[1, 0]
-        _det = 1 / _tmp
-        _dim[0, 0] = _det * _dm[1, 1]
-        _dim[0, 1] = -1 * _det * _dm[0, 1]
-        _dim[1, 0] = -1 * _det * _dm[1, 0]
-        _dim[1, 1] = _det * _dm[0, 0]
+        # For both polarizations _dm has the form [[a, a], [b, -b]], so
+        # det = -2ab and the inverse is [[1/2a, 1/2b], [1/2a, -1/2b]]
+        _half_inv_a = 0.5 / _dm[..., 0, 0]
+        _half_inv_b = 0.5 / _dm[..., 1, 0]
+        _dim[..., 0, 0] = _half_inv_a
+        _dim[..., 0, 1] = _half_inv_b
+        _dim[..., 1, 0] = _half_inv_a
+        _dim[..., 1, 1] = -1 * _half_inv_b
 
         return _dm, _dim
 
+    def _compute_intermediate_layer_matrices(
+        self, _refractive_index, _cosine_theta, _phil, _layers=None
+    ):
+        """compute the layer matrices of layers 1 ... number_of_layers - 2 with one
+        vectorized call to _compute_layer_matrix
+        Arguments
+        ---------
+            _refractive_index : ... x number_of_layers numpy array of complex floats
+                refractive index of each layer
+            _cosine_theta : ... x number_of_layers numpy array of complex floats
+                cosine of the complex refraction angle within each layer
+            _phil : ... x number_of_layers numpy array of complex floats
+                kz * d of each layer
+            _layers : list of ints, optional
+                the layers to build matrices for; defaults to every intermediate layer
+        Returns
+        -------
+        _lm : len(_layers) x ... x 2 x 2 numpy array of complex floats
+            the layer matrices with the layer axis first, so that the matrices
+            of one layer are contiguous in memory for the transfer matrix chain
+        """
+        if _layers is None:
+            _layers = slice(1, self.number_of_layers - 1)
+        return self._compute_layer_matrix(
+            np.moveaxis(_refractive_index[..., _layers], -1, 0),
+            np.moveaxis(_cosine_theta[..., _layers], -1, 0),
+            np.moveaxis(_phil[..., _layers], -1, 0),
+        )
+
+    def _compute_layer_matrix(self, refractive_index, cosine_theta, phil):
+        """compute the product D P D_inv for an intermediate layer in closed form
+        Arguments
+        ---------
+            refractive_index : complex float or numpy array of complex floats
+                refractive index of the layer
+            cosine_theta : complex float or numpy array of complex floats
+                cosine of the complex refraction angle within the layer
+            phil : complex float or numpy array of complex floats
+                kz * d of the layer
+        Attributes
+        ----------
+            polarization : str
+                string indicating the polarization convention of the incident light
+        Returns
+        -------
+        _lm : ... x 2 x 2 numpy array of complex floats
+            [[cos(phil), -i sin(phil) / eta], [-i eta sin(phil), cos(phil)]]
+            where eta = n cos(theta) for s-polarization and n / cos(theta) for p-polarization
+        """
+        _eta = self._compute_eta(refractive_index, cosine_theta)
+        _cos_phil, _sin_phil = _compute_cos_sin(phil)
+
+        _lm = np.empty(np.broadcast(_eta, phil).shape + (2, 2), dtype=complex)
+        _lm[..., 0, 0] = _cos_phil
+        _lm[..., 0, 1] = -1j * _sin_phil / _eta
+        _lm[..., 1, 0] = -1j * _eta * _sin_phil
+        _lm[..., 1, 1] = _cos_phil
+
+        return _lm
+
+    def _compute_layer_matrix_analytical_gradient(
+        self, refractive_index, cosine_theta, kzl, phil
+    ):
+        """compute the derivative of the layer matrix D P D_inv with respect to layer thickness
+        Arguments
+        ---------
+            refractive_index : complex float or numpy array of complex floats
+                refractive index of the layer
+            cosine_theta : complex float or numpy array of complex floats
+                cosine of the complex refraction angle within the layer
+            kzl : complex float or numpy array of complex floats
+                the z-component of the wavevector in layer l
+            phil : complex float or numpy array of complex floats
+                kzl * sl where sl is the thickness of layer l
+        Returns
+        -------
+        _lm_analytical_gradient : ... x 2 x 2 numpy array of complex floats
+            D dP/dsl D_inv, the analytical derivative of the layer matrix
+        """
+        _eta = self._compute_eta(refractive_index, cosine_theta)
+        _cos_phil, _sin_phil = _compute_cos_sin(phil)
+
+        _lm_analytical_gradient = np.empty(
+            np.broadcast(_eta, phil).shape + (2, 2), dtype=complex
+        )
+        _lm_analytical_gradient[..., 0, 0] = -kzl * _sin_phil
+        _lm_analytical_gradient[..., 0, 1] = -1j * kzl * _cos_phil / _eta
+        _lm_analytical_gradient[..., 1, 0] = -1j * kzl * _eta * _cos_phil
+        _lm_analytical_gradient[..., 1, 1] = -kzl * _sin_phil
+
+        return _lm_analytical_gradient
+
+    def _compute_eta(self, refractive_index, cosine_theta):
+        """compute the ratio D[1, 0] / D[0, 0] of the D matrix of a layer,
+        which is all the layer matrix depends on
+        """
+        if self.polarization == "s":
+            return refractive_index * cosine_theta
+        elif self.polarization == "p":
+            return refractive_index / cosine_theta
+
     def _compute_pm(self, phil):
-        """compute the P matrices for each intermediate-layer layer and wavelength
+        """compute the P matrices for each intermediate-layer layer and wavelength;
+        reference-only (tests): the transfer matrix chain uses the fused
+        _compute_layer_matrix = D P D_inv instead
         Arguments
         ---------
-            phil : complex float
+            phil : complex float or numpy array of complex floats
                 kz * d of the current layer
         Returns
         -------
-        _pm
+        _pm : ... x 2 x 2 numpy array of complex floats
         """
 
-        _pm = np.zeros((2, 2), dtype=complex)
+        _pm = np.zeros(np.shape(phil) + (2, 2), dtype=complex)
         _ci = 0 + 1j
-        _a = -1 * _ci * phil
         _b = _ci * phil
 
-        _pm[0, 0] = np.exp(_a)
-        _pm[1, 1] = np.exp(_b)
+        # exp(i phil) and exp(-i phil) are reciprocals, so share one exponential
+        _pm[..., 1, 1] = np.exp(_b)
+        _pm[..., 0, 0] = 1 / _pm[..., 1, 1]
 
         return _pm
 
     def _compute_pm_analytical_gradient(self, kzl, phil):
-        """compute the derivative of the P matrix with respect to layer thickness
+        """compute the derivative of the P matrix with respect to layer thickness;
+        reference-only (tests): the gradients use the fused
+        _compute_layer_matrix_analytical_gradient = D dP/dsl D_inv instead
 
         Arguments
         ---------
-            kzl : complex float
+            kzl : complex float or numpy array of complex floats
                 the z-component of the wavevector in layer l
-            phil : complex float
+            phil : complex float or numpy array of complex floats
                 kzl * sl where sl is the thickness of layer l
         Reference
         ---------
             Equation 18 of https://journals.aps.org/prresearch/pdf/10.1103/PhysRevResearch.2.013018
         Returns
         -------
-            _pm_analytical_gradient : 2x2 numpy array of complex floats
+            _pm_analytical_gradient : ... x 2 x 2 numpy array of complex floats
                 the analytical derivative of the P matrix with respect to thickness of layer l
 
         """
-        _pm_analytical_gradient = np.zeros((2, 2), dtype=complex)
+        _pm_analytical_gradient = np.zeros(np.shape(phil) + (2, 2), dtype=complex)
         _ci = 0 + 1j
-        _a = -1 * _ci * phil
         _b = _ci * phil
 
-        _pm_analytical_gradient[0, 0] = -_ci * kzl * np.exp(_a)
-        _pm_analytical_gradient[1, 1] = _ci * kzl * np.exp(_b)
+        # exp(i phil) and exp(-i phil) are reciprocals, so share one exponential
+        _exp_b = np.exp(_b)
+        _pm_analytical_gradient[..., 0, 0] = -_ci * kzl / _exp_b
+        _pm_analytical_gradient[..., 1, 1] = _ci * kzl * _exp_b
 
         return _pm_analytical_gradient
 
@@ -1,15 +1,119 @@
 import numpy as np
-from scipy.interpolate import InterpolatedUnivariateSpline
 import os
+from functools import lru_cache
 from scipy import constants
 
 path_and_file = os.path.realpath(__file__)
 path = path_and_file[:-12]
 
 
+@lru_cache(maxsize=None)
+def _read_data_file(file_path):
+    """read a tabulated data file (e.g. refractive index data) with np.loadtxt,
+    caching the result so that each file is only read from disk once per process.
+    The returned array is shared between all callers, so it is made read-only.
+
+    Arguments
+    ---------
+        file_path : str
+            the full path to the data file
+
+    Returns
+    -------
+        file_data : numpy array of floats
+            the contents of the data file
+    """
+    file_data = np.loadtxt(file_path)
+    file_data.setflags(write=False)
+    return file_data
+
+
+def _interpolate_linear(x, xp, fp):
+    """piecewise linear interpolation of the tabulated values fp(xp) at x with a
+    single call to np.interp.  Outside of [xp[0], xp[-1]] the first and last
+    segments are extended linearly (as a k=1 InterpolatedUnivariateSpline does)
+    rather than clamped to the end values
+
+    Arguments
+    ---------
+        x : float or numpy array of floats
+            the points to evaluate the interpolant at
+        xp : numpy array of floats
+            the increasing tabulated abscissae
+        fp : numpy array of floats or complex floats
+            the tabulated values, e.g. n + 1j * k
+
+    Returns
+    -------
+        f : float or numpy array of floats or complex floats
+            the interpolated values at x
+    """
+    x = np.asarray(x)
+    f = np.interp(x, xp, fp)
+
+    _slope_lo = (fp[1] - fp[0]) / (xp[1] - xp[0])
+    _slope_hi = (fp[-1] - fp[-2]) / (xp[-1] - xp[-2])
+    f = np.where(x < xp[0], fp[0] + _slope_lo * (x - xp[0]), f)
+    f = np.where(x > xp[-1], fp[-1] + _slope_hi * (x - xp[-1]), f)
+
+    return f
+
+
 class Materials:
     """Compute the absorption, scattering, and extinction spectra of a sphere using Mie theory"""
 
+    # lower-case material names understood by _set_material and the
+    # material_* method that defines each of them
+    _material_methods = {
+        "air": "material_Air",
+        "vacuum": "material_Air",
+        "ag": "material_Ag",
+        "al": "material_Al",
+        "al2o3": "material_Al2O3",
+        "al2o3_udm": "material_Al2O3_UDM",
+        "aln": "material_AlN",
+        "au": "material_Au",
+        "hfo2": "material_HfO2",
+        "pb": "material_Pb",
+        "polystyrene": "material_polystyrene",
+        "pt": "material_Pt",
+        "re": "material_Re",
+        "rh": "material_Rh",
+        "ru": "material_Ru",
+        "si": "material_Si",
+        "sio2": "material_SiO2",
+        "sio2_udm": "material_SiO2_UDM",
+        "ta2o5": "material_Ta2O5",
+        "tin": "material_TiN",
+        "tio2": "material_TiO2",
+        "w": "material_W",
+        "zro2": "material_ZrO2",
+        "si3n4": "material_Si3N4",
+    }
+
+    def _set_material(self, layer_number, material_name):
+        """defines the refractive index of layer layer_number from the name of a
+        supported material with a single dictionary lookup
+
+        Arguments
+        ----------
+            layer_number : int
+                specifies the layer whose refractive index will be defined
+            material_name : str
+                name of the material, e.g. "SiO2"; the comparison is case insensitive
+
+        Returns
+        -------
+            bool
+                True if material_name is a supported material, False otherwise
+                so that the caller can fall back (e.g. to reading a file)
+        """
+        _method_name = self._material_methods.get(material_name.lower())
+        if _method_name is None:
+            return False
+        getattr(self, _method_name)(layer_number)
+        return True
+
     def _create_test_multilayer(self, central_wavelength):
         """
         Simple method to create a 3-entry array of wavelengths as follows:
@@ -67,9 +171,7 @@ class Materials:
         """defines the refractive index layer of layer_number to be water
         assuming static refractive index of n = 1.33 + 0j
         """
-        self._refractive_index_array[:, layer_number] = (
-            np.ones(len(self.wavelength_array), dtype=complex) * 1.33
-        )
+        self._refractive_index_array[:, layer_number] = 1.33 + 0j
 
     def insert_layer(self, layer_number):
         """insert an air layer between layer_number-1 and layer_number
@@ -94,9 +196,8 @@ class Materials:
         """defines the refractive index layer of layer_number to be air
         assuming static refractive index of n = 1.0 + 0j
         """
-        self._refractive_index_array[:, layer_number] = (
-            np.ones(len(self.wavelength_array), dtype=complex) * 1.0
-        )
+        # constant refractive index, so no need to read or interpolate any data
+        self._refractive_index_array[:, layer_number] = 1.0 + 0j
 
     def material_from_file(self, layer_number, file_name):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -132,12 +233,7 @@ class Materials:
             # get path to the sio2 data file
             file_path = path + "data/" + file_name
             # now read SiO2 data into a numpy array
-            file_data = np.loadtxt(file_path)
-            # file_path[:,0] -> wavelengths in meters
-            # file_path[:,1] -> real part of the refractive index
-            # file_path[:,2] -> imaginary part of the refractive index
-            # now read Ag data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
@@ -146,17 +242,10 @@ class Materials:
             # in a data set; we want only the unique elements
             idx = self._find_unique_ri_file_data(file_data[:, 0])
 
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[idx, 0], file_data[idx, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[idx, 0], file_data[idx, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[idx, 0], file_data[idx, 1] + 1j * file_data[idx, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_2D_HOIP(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be 2D hybrid organic-inorganic
@@ -183,21 +272,14 @@ class Materials:
             # get path to the sio2 data file
             file_path = path + "data/2D_HOIP.txt"
             # now read SiO2 data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
 
     def material_SiO2(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -227,21 +309,14 @@ class Materials:
             # get path to the sio2 data file
             file_path = path + "data/SiO2_ir.txt"
             # now read SiO2 data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_TiO2(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be TiO2
@@ -269,20 +344,13 @@ class Materials:
             # get path to the TiO2 data file
             file_path = path + "data/TiO2_Siefke.txt"
             # now read TiO2 data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Ta2O5(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -355,20 +423,13 @@ class Materials:
                     file_path = path + "data/Ta2O5_Bright.txt"
 
             # now read Ta2O5 data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_TiN(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -397,26 +458,17 @@ class Materials:
             # get path to the tin data file
             file_path = path + "data/TiN_ellipsometry_data.txt"
             # now read Tin data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_static_refractive_index(self, layer_number, refractive_index):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
-            self._refractive_index_array[:, layer_number] = (
-                np.ones(len(self.wavelength_array), dtype=complex) * refractive_index
-            )
+            self._refractive_index_array[:, layer_number] = refractive_index
 
     def material_Al(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -445,21 +497,14 @@ class Materials:
             # get path to the Al data file
             file_path = path + "data/Al_Rakic.txt"
             # now read Al data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_Pt(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be Pt
@@ -490,16 +535,10 @@ class Materials:
             # get path to the Platinum data file
             file_path = path + "data/Pt_Rakic.txt"
             # now read Platinum data into a numpy array
-            file_data = np.loadtxt(file_path)
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            file_data = _read_data_file(file_path)
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_HfO2(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -531,19 +570,13 @@ class Materials:
             # get path to the HfO2 data file
             file_path = path + "data/HfO2_Al-Kuhaili.txt"
 
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Au(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -615,20 +648,13 @@ class Materials:
                     file_path = path + "data/Au_IR.txt"
 
             # now read Au data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Rh(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -660,19 +686,13 @@ class Materials:
             # get path to the Rh data file
             file_path = path + "data/Rh_Weaver.txt"
             # now read Rh data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Al2O3(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -704,19 +724,13 @@ class Materials:
             # get path to the Al2O3 data file
             file_path = path + "data/Al2O3_ri.txt"
             # now read Au data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Ru(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -748,20 +762,13 @@ class Materials:
             # get path to the Ru data file
             file_path = path + "data/Ru.txt"
             # now read Ru data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_polystyrene(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -793,19 +800,13 @@ class Materials:
             # get path to the polystyrene data file
             file_path = path + "data/Polystyrene.txt"
             # now read Au data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_AlN(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -878,20 +879,13 @@ class Materials:
                     file_path = path + "data/AlN_Kischkat.txt"
 
             # now read AlN data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_W(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -964,20 +958,13 @@ class Materials:
                     file_path = path + "data/W_Ordal.txt"
 
             # now read W data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Si(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -1050,21 +1037,14 @@ class Materials:
                     file_path = path + "data/Si_Shkondin.txt"
 
             # now read Si data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_Si3N4(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be Si3N4
@@ -1092,21 +1072,14 @@ class Materials:
             # get path to the Si3N4 data file
             file_path = path + "data/Si3N4_Luke.txt"
             # now read Tin data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_ZrO2(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be ZrO2
@@ -1134,21 +1107,14 @@ class Materials:
             # get path to the Zr02 data file
             file_path = path + "data/ZrO2_Wood.txt"
             # now read Tin data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_SiO2_UDM(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be SiO2 using a universal dispersion model (UDM)
@@ -1176,7 +1142,7 @@ class Materials:
             # get path to the Si02 data file
             file_path = path + "data/SiO2_udm.txt"
             # now read Tin data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
@@ -1188,16 +1154,9 @@ class Materials:
             n_array = np.flip(file_data[:,1])
             k_array = np.flip(file_data[:,2])
 
-            n_spline = InterpolatedUnivariateSpline(
-                wl_si, n_array, k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, wl_si, n_array + 1j * k_array
             )
-            k_spline = InterpolatedUnivariateSpline(
-                wl_si, k_array, k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
             
     def material_Al2O3_UDM(self, layer_number):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -1226,7 +1185,7 @@ class Materials:
             # get path to the Al203 data file
             file_path = path + "data/Al2O3_udm.txt"
             # now read Tin data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
@@ -1238,16 +1197,9 @@ class Materials:
             n_array = np.flip(file_data[:,1])
             k_array = np.flip(file_data[:,2])
 
-            n_spline = InterpolatedUnivariateSpline(
-                wl_si, n_array, k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, wl_si, n_array + 1j * k_array
             )
-            k_spline = InterpolatedUnivariateSpline(
-                wl_si, k_array, k=1
-            )
-
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
 
     def material_Re(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
@@ -1320,21 +1272,14 @@ class Materials:
                     file_path = path + "data/Re_Palik.txt"
 
             # now read Re data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_Ag(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be Ag
@@ -1401,7 +1346,7 @@ class Materials:
                     file_path = path + "data/Ag_Yang.txt"
 
             # now read Ag data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
@@ -1410,17 +1355,10 @@ class Materials:
             # in a data set; we want only the unique elements
             idx = self._find_unique_ri_file_data(file_data[:, 0])
 
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[idx, 0], file_data[idx, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[idx, 0], file_data[idx, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[idx, 0], file_data[idx, 1] + 1j * file_data[idx, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def material_Pb(self, layer_number, wavelength_range="visible", override="true"):
         if layer_number > 0 and layer_number < (self.number_of_layers - 1):
             """defines the refractive index of layer layer_number to be Pb
@@ -1487,21 +1425,14 @@ class Materials:
                     file_path = path + "data/Pb_Ordal.txt"
 
             # now read Pb data into a numpy array
-            file_data = np.loadtxt(file_path)
+            file_data = _read_data_file(file_path)
             # file_path[:,0] -> wavelengths in meters
             # file_path[:,1] -> real part of the refractive index
             # file_path[:,2] -> imaginary part of the refractive index
-            n_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 1], k=1
-            )
-            k_spline = InterpolatedUnivariateSpline(
-                file_data[:, 0], file_data[:, 2], k=1
+            self._refractive_index_array[:, layer_number] = _interpolate_linear(
+                self.wavelength_array, file_data[:, 0], file_data[:, 1] + 1j * file_data[:, 2]
             )
 
-            self._refractive_index_array[:, layer_number] = n_spline(
-                self.wavelength_array
-            ) + 1j * k_spline(self.wavelength_array)
-
     def _read_CIE(self):
         """Reads CIE data and stores as attributes self.cie_cr, self.cie_cg, self.cie_cb
 
@@ -1536,30 +1467,32 @@ class Materials:
         # get path to the cie data
         file_path = path + "data/cie_cmf.txt"
         # now read Rh data into a numpy array
-        file_data = np.loadtxt(file_path)
+        file_data = _read_data_file(file_path)
         # file_data[:,0] -> wavelengths in nm
         # file_data[:,1] -> cr response function
         # file_data[:,2] -> cg response function
         # file_data[:,3] -> cb resposne function
 
-        _cr_spline = InterpolatedUnivariateSpline(
-            file_data[:, 0] * 1e-9, file_data[:, 1], k=1
+        _cie_wavelength = file_data[:, 0] * 1e-9
+
+        # values of data file at 500 nm
+        expected_values = np.array([0.0049, 0.3230, 0.2720])
+        interp_values = np.array(
+            [
+                _interpolate_linear(500e-9, _cie_wavelength, file_data[:, i])
+                for i in range(1, 4)
+            ]
         )
-        _cg_spline = InterpolatedUnivariateSpline(
-            file_data[:, 0] * 1e-9, file_data[:, 2], k=1
+        assert np.allclose(expected_values, interp_values)
+        self._cie_cr[:] = _interpolate_linear(
+            self.wavelength_array, _cie_wavelength, file_data[:, 1]
         )
-        _cb_spline = InterpolatedUnivariateSpline(
-            file_data[:, 0] * 1e-9, file_data[:, 3], k=1
+        self._cie_cg[:] = _interpolate_linear(
+            self.wavelength_array, _cie_wavelength, file_data[:, 2]
         )
-        # values of data file at 500 nm
-        expected_values = np.array([0.0049, 0.3230, 0.2720])
-        spline_values = np.array(
-            [_cr_spline(500e-9), _cg_spline(500e-9), _cb_spline(500e-9)]
+        self._cie_cb[:] = _interpolate_linear(
+            self.wavelength_array, _cie_wavelength, file_data[:, 3]
         )
-        assert np.allclose(expected_values, spline_values)
-        self._cie_cr[:] = _cr_spline(self.wavelength_array)
-        self._cie_cg[:] = _cg_spline(self.wavelength_array)
-        self._cie_cb[:] = _cb_spline(self.wavelength_array)
 
     def _read_AM(self):
         """Reads AM1.5 data and returns an array of the AM1.5 data evaluated at each value of
@@ -1587,20 +1520,18 @@ class Materials:
         # get path to the AM data
         file_path = path + "data/scaled_AM_1_5.txt"
         # now read Rh data into a numpy array
-        file_data = np.loadtxt(file_path)
+        file_data = _read_data_file(file_path)
         # file_data[:,0] -> wavelengths in m
         # file_data[:,1] -> solar spectrum in W / m / m^2 / sr
 
-        _solar_spline = InterpolatedUnivariateSpline(
-            file_data[:, 0], file_data[:, 1], k=1
-        )
-
         # values of data file at 615 nm
         # 0.000000615000000       1325400000.0000000000000000000000
         _expected_value = 1325400000.0
-        _spline_value = _solar_spline(615e-9)
-        assert np.isclose(_expected_value, _spline_value)
-        return _solar_spline(self.wavelength_array)
+        _interp_value = _interpolate_linear(615e-9, file_data[:, 0], file_data[:, 1])
+        assert np.isclose(_expected_value, _interp_value)
+        return _interpolate_linear(
+            self.wavelength_array, file_data[:, 0], file_data[:, 1]
+        )
 
     def _read_Atmospheric_Transmissivity(self):
         """Reads atmospherical transmissivity data and returns
@@ -1627,22 +1558,22 @@ class Materials:
         # get path to the AM data
         file_path = path + "data/Atmospheric_transmissivity.txt"
         # now read Rh data into a numpy array
-        file_data = np.loadtxt(file_path)
+        file_data = _read_data_file(file_path)
         # file_data[:,0] -> wavelengths in m
         # file_data[:,1] -> atmospheric transmissivity
 
         # get indices of unique elements
         idx = self._find_unique_ri_file_data(file_data[:, 0])
 
-        _atrans_spline = InterpolatedUnivariateSpline(
-            file_data[idx, 0], file_data[idx, 1], k=1
-        )
-
         # values of data file at 7.1034e-06 meters (7.1034 microns) -> T = 0.561289
         _expected_value = 0.561289
-        _spline_value = _atrans_spline(7.1034e-6)
-        assert np.isclose(_expected_value, _spline_value)
-        return _atrans_spline(self.wavelength_array)
+        _interp_value = _interpolate_linear(
+            7.1034e-6, file_data[idx, 0], file_data[idx, 1]
+        )
+        assert np.isclose(_expected_value, _interp_value)
+        return _interpolate_linear(
+            self.wavelength_array, file_data[idx, 0], file_data[idx, 1]
+        )
     
     def _EQE_spectral_response(self):
         """ 
@@ -1667,10 +1598,6 @@ class Materials:
                         Table of EQE values extrapolated from graph.
         _sr_array : 
                         Calculated spectral response based on formula, wavelength, tabulated values, and constants.
-        _eqe_spline :
-                        Spline best fit based on wavelength array and EQE data.
-        _sr_spline :
-                        Spline best fit based on SR array and wavelength array.
 
         Returns
         -------
@@ -1701,16 +1628,12 @@ class Materials:
         _eqe_array = _eqe_array * 0.01
         _sr_array = constants.e * _eqe_array * _wavelength_array / (constants.h * constants.c)
 
-        # Spline for line of best fit based on current data
-        _eqe_spline = InterpolatedUnivariateSpline(
-            _wavelength_array, _eqe_array, k=1
+        # Linear interpolation of the tabulated data
+        self.perovskite_eqe = _interpolate_linear(
+            self.wavelength_array, _wavelength_array, _eqe_array
+        )
+        self.perovskite_spectral_response = _interpolate_linear(
+            self.wavelength_array, _wavelength_array, _sr_array
         )
-
-        _sr_spline = InterpolatedUnivariateSpline(
-                _wavelength_array, _sr_array, k=1
-            )
-        
-        self.perovskite_eqe = _eqe_spline(self.wavelength_array)
-        self.perovskite_spectral_response = _sr_spline(self.wavelength_array)
     
 
@@ -135,54 +135,9 @@ class MieDriver(SpectrumDriver, Materials):
         elif _lmed == "h2o":
             self.material_H2O(0)
 
-        _lm = self.sphere_material.lower()
-
-        # check all possible values of the material string
-        # and set material as appropriate.
-        # in future probably good to create a single wrapper
-        # function in materials.py that will do this so
-        # that MieDriver and TmmDriver can just use it rather
-        # than duplicating this kind of code in both classes
-        if _lm == "air":
-            self.material_Air(1)
-        elif _lm == "ag":
-            self.material_Ag(1)
-        elif _lm == "al":
-            self.material_Al(1)
-        elif _lm == "al2o3":
-            self.material_Al2O3(1)
-        elif _lm == "aln":
-            self.material_AlN(1)
-        elif _lm == "au":
-            self.material_Au(1)
-        elif _lm == "hfo2":
-            self.material_HfO2(1)
-        elif _lm == "pb":
-            self.material_Pb(1)
-        elif _lm == "polystyrene":
-            self.material_polystyrene(1)
-        elif _lm == "pt":
-            self.material_Pt(1)
-        elif _lm == "re":
-            self.material_Re(1)
-        elif _lm == "rh":
-            self.material_Rh(1)
-        elif _lm == "ru":
-            self.material_Ru(1)
-        elif _lm == "si":
-            self.material_Si(1)
-        elif _lm == "sio2":
-            self.material_SiO2(1)
-        elif _lm == "ta2O5":
-            self.material_Ta2O5(1)
-        elif _lm == "tin":
-            self.material_TiN(1)
-        elif _lm == "tio2":
-            self.material_TiO2(1)
-        elif _lm == "w":
-            self.material_W(1)
-        # default is SiO2
-        else:
+        # set the sphere material with the materials dictionary
+        # shared with TmmDriver; default is SiO2
+        if not self._set_material(1, self.sphere_material):
             self.material_SiO2(1)
 
         self._relative_refractive_index_array = (
@@ -1,7 +1,32 @@
 from abc import abstractmethod, ABC
+import numpy as np
 
 
 class SpectrumDriver(ABC):
     @abstractmethod
     def compute_spectrum():
         pass
+
+    @property
+    def wavelength_array(self):
+        """the wavelengths that will illuminate the structure in SI units"""
+        return self._wavelength_array
+
+    @wavelength_array.setter
+    def wavelength_array(self, value):
+        # quantities that depend only on the wavelengths (e.g. _k0_array and the
+        # blackbody spectrum) are cached in _spectrum_cache; assigning a new
+        # wavelength_array invalidates them
+        self._wavelength_array = value
+        self._spectrum_cache = {}
+        self._spectrum_cache_wavelengths = np.array(value, copy=True)
+
+    def _get_spectrum_cache(self):
+        """returns _spectrum_cache, first clearing it if wavelength_array has been
+        modified in place since the cached quantities were computed"""
+        if not np.array_equal(self._spectrum_cache_wavelengths, self._wavelength_array):
+            self._spectrum_cache = {}
+            self._spectrum_cache_wavelengths = np.array(
+                self._wavelength_array, copy=True
+            )
+        return self._spectrum_cache
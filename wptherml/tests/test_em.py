@@ -308,6 +308,54 @@ def test_compute_explicit_angle_spectrum():
     assert np.allclose(test.emissivity_array_s[:, 1], _expected_e_s, 5e-3)
 
 
+def test_explicit_angle_spectrum_batched():
+    """
+    Test that the angle-resolved spectra computed for all angles at once match
+    compute_spectrum evaluated at each angle and polarization separately
+    """
+    test_args = {
+        "wavelength_list": [400e-9, 2000e-9, 20],
+        "material_list": ["Air", "SiO2", "TiO2", "Ag", "Air"],
+        "thickness_list": [0, 230e-9, 50e-9, 30e-9, 0],
+    }
+    ts = sf.spectrum_factory("Tmm", test_args)
+    ts.compute_explicit_angle_spectrum()
+
+    # the structure is left at the last angle with p-polarization
+    assert np.isclose(ts.incident_angle, ts.theta_vals[-1])
+    assert ts.polarization == "p"
+
+    ref = sf.spectrum_factory("Tmm", test_args)
+    for i, _theta in enumerate(ts.theta_vals):
+        ref.incident_angle = _theta
+        for _pol in ["s", "p"]:
+            ref.polarization = _pol
+            ref.compute_spectrum()
+            assert np.allclose(
+                getattr(ts, "reflectivity_array_" + _pol)[i], ref.reflectivity_array
+            )
+            assert np.allclose(
+                getattr(ts, "transmissivity_array_" + _pol)[i],
+                ref.transmissivity_array,
+            )
+            assert np.allclose(
+                getattr(ts, "emissivity_array_" + _pol)[i], ref.emissivity_array
+            )
+
+
+def test_gauss_legendre_grid():
+    """
+    Test that the cached Gauss-Legendre angular grid integrates
+    cos(theta) sin(theta) over [0, pi/2] exactly and is shared between calls
+    """
+    from wptherml.em import _gauss_legendre_grid
+
+    x, theta_vals, theta_weights = _gauss_legendre_grid(7, 0, np.pi / 2.0)
+    assert _gauss_legendre_grid(7, 0, np.pi / 2.0)[1] is theta_vals
+    assert not theta_weights.flags.writeable
+    assert np.isclose(np.sum(np.cos(theta_vals) * np.sin(theta_vals) * theta_weights), 0.5)
+
+
 def test_pm_grad():
     """
     structure = {
@@ -347,6 +395,48 @@ def test_pm_grad():
     assert np.allclose(pml, expected_pml)
 
 
+def test_layer_matrix_grad():
+    """
+    Test that the fused layer matrix and its thickness derivative match
+    D P D_inv and D dP/dsl D_inv built from the P matrix and its derivative
+    (Equation 18 of https://journals.aps.org/prresearch/pdf/10.1103/PhysRevResearch.2.013018)
+    """
+
+    test_args = {
+        "wavelength_list": [600e-9, 602e-9, 3],
+        "material_list": [
+            "Air",
+            "SiO2",
+            "Air",
+        ],
+        "thickness_list": [0, 200e-9, 0],
+    }
+
+    ts = sf.spectrum_factory("Tmm", test_args)
+    _kz = 15475380.92450645 + 0.0j
+    _phil = 3.09507618 + 0.0j
+    _ri = ts._refractive_index_array[0, 1]
+    _cos_theta = 1.0 + 0j
+
+    _pm = ts._compute_pm(_phil)
+    expected_pml = np.array(
+        [
+            [-719600.49694137 + 15458641.26899191j, 0 + 0j],
+            [0.00000000e00 + 0j, -719600.49694137 - 15458641.26899191j],
+        ]
+    )
+
+    for _pol in ["s", "p"]:
+        ts.polarization = _pol
+        _dm, _dim = ts._compute_dm(_ri, _cos_theta)
+
+        _lm = ts._compute_layer_matrix(_ri, _cos_theta, _phil)
+        assert np.allclose(_lm, _dm @ _pm @ _dim)
+
+        _lml = ts._compute_layer_matrix_analytical_gradient(_ri, _cos_theta, _kz, _phil)
+        assert np.allclose(_lml, _dm @ expected_pml @ _dim)
+
+
 def test_compute_spectrum_gradient():
 
     # simple structure - just glass layer
@@ -465,7 +555,184 @@ def test_tm_grad():
 
     assert np.allclose(M, expected_M0)
 
-    
+
+def test_tm_and_gradient():
+    """
+    Test that the transfer matrix and its gradient with respect to every layer
+    obtained from a single forward / backward sweep match _compute_tm and
+    _compute_tm_gradient evaluated layer by layer
+    """
+    test_args = {
+        "wavelength_list": [400e-9, 800e-9, 5],
+        "material_list": ["Air", "SiO2", "TiO2", "SiO2", "Ag", "Air"],
+        "thickness_list": [0, 200e-9, 100e-9, 300e-9, 20e-9, 0],
+        "incident_angle": 30.0,
+        "polarization": "p",
+    }
+    ts = sf.spectrum_factory("Tmm", test_args)
+
+    _ri = ts._refractive_index_array
+    _k0 = ts._k0_array
+    _kz = ts._kz_array
+    _d = ts.thickness_array
+    _layers = np.array([1, 2, 3, 4])
+
+    M, dM, theta, ctheta = ts._compute_tm_and_gradient(_ri, _k0, _kz, _d, _layers)
+    expected_M, _, _ = ts._compute_tm(_ri, _k0, _kz, _d)
+
+    assert np.allclose(M, expected_M)
+    for j, _ln in enumerate(_layers):
+        expected_dM, _, _ = ts._compute_tm_gradient(_ri, _k0, _kz, _d, _ln)
+        assert np.allclose(dM[:, j], expected_dM)
+
+    # a directional derivative from the forward pass is the gradient projected on the direction
+    _v = np.array([[0.0, 1.0, -0.5, 2.0, 0.25, 0.0]])
+    M_jvp, dM_jvp, _, _ = ts._compute_tm_jvp(_ri, _k0, _kz, _d, _v)
+    assert np.allclose(M_jvp, expected_M)
+    assert np.allclose(
+        dM_jvp[:, 0], np.einsum("j,wjab->wab", _v[0, _layers], dM)
+    )
+
+    # short gradient lists take the forward-mode path
+    M_fwd, dM_fwd, _, _ = ts._compute_tm_and_gradient(_ri, _k0, _kz, _d, _layers[2:])
+    assert np.allclose(M_fwd, expected_M)
+    assert np.allclose(dM_fwd, dM[:, 2:])
+
+
+def test_normal_incidence_spectrum():
+    """
+    Test that the normal-incidence shortcut for kz and the refraction angles agrees
+    with the general oblique-incidence path in the limit of vanishing angle, and that
+    s- and p-polarized spectra coincide at normal incidence
+    """
+    _spectra = {}
+    for _angle in [0.0, 1e-8]:
+        for _pol in ["s", "p"]:
+            test_args = {
+                "wavelength_list": [300e-9, 2000e-9, 50],
+                "material_list": ["Air", "SiO2", "W", "TiN", "Air"],
+                "thickness_list": [0, 230e-9, 10e-9, 100e-9, 0],
+                "incident_angle": _angle,
+                "polarization": _pol,
+            }
+            ts = sf.spectrum_factory("Tmm", test_args)
+            _spectra[(_angle, _pol)] = np.array(
+                [ts.reflectivity_array, ts.transmissivity_array, ts.emissivity_array]
+            )
+
+    for _pol in ["s", "p"]:
+        assert np.allclose(_spectra[(0.0, _pol)], _spectra[(1e-8, _pol)])
+    assert np.allclose(_spectra[(0.0, "s")], _spectra[(0.0, "p")])
+
+
+def test_matmul_2x2():
+    """
+    Test the element-by-element 2 x 2 product against np.matmul, including
+    broadcasting over the leading axes
+    """
+    from wptherml.em import _matmul_2x2
+
+    rng = np.random.default_rng(7)
+    _a = rng.normal(size=(5, 3, 2, 2)) + 1j * rng.normal(size=(5, 3, 2, 2))
+    _b = rng.normal(size=(3, 2, 2)) + 1j * rng.normal(size=(3, 2, 2))
+
+    assert np.allclose(_matmul_2x2(_a, _b), np.matmul(_a, _b))
+
+    _out = np.empty_like(_a)
+    _matmul_2x2(_a, _b, out=_out)
+    assert np.allclose(_out, np.matmul(_a, _b))
+
+
+def test_update_layer():
+    """
+    Test that updating the thickness of one layer from the cached partial products
+    gives the same spectra as recomputing the full structure
+    """
+    test_args = {
+        "wavelength_list": [400e-9, 800e-9, 11],
+        "material_list": ["Air", "SiO2", "TiO2", "SiO2", "Ag", "Air"],
+        "thickness_list": [0, 200e-9, 100e-9, 300e-9, 20e-9, 0],
+        "incident_angle": 45.0,
+        "polarization": "s",
+    }
+    ts = sf.spectrum_factory("Tmm", test_args)
+    ref = sf.spectrum_factory("Tmm", test_args)
+
+    # finite-difference style updates of layer 2, then an update of layer 3
+    for _ln, _new_d in [(2, 101e-9), (2, 99e-9), (3, 250e-9)]:
+        ts._update_layer(_ln, _new_d)
+        ref.thickness_array[_ln] = _new_d
+        ref.compute_spectrum()
+
+        assert np.allclose(ts.thickness_array, ref.thickness_array)
+        assert np.allclose(ts.reflectivity_array, ref.reflectivity_array)
+        assert np.allclose(ts.transmissivity_array, ref.transmissivity_array)
+        assert np.allclose(ts.emissivity_array, ref.emissivity_array)
+
+    # the terminal media have no layer matrix to update
+    for _ln in [0, ts.number_of_layers - 1, -1, ts.number_of_layers]:
+        with pytest.raises(ValueError):
+            ts._update_layer(_ln, 50e-9)
+
+
+def test_periodic_stack_tm():
+    """
+    Test that the transfer matrix of a Bragg mirror built from powers of the
+    repeated SiO2 / TiO2 bilayer matches the layer-by-layer product
+    """
+    _n_pairs = 12
+    test_args = {
+        "wavelength_list": [400e-9, 800e-9, 7],
+        "material_list": ["Air"] + ["SiO2", "TiO2"] * _n_pairs + ["Ag", "Air"],
+        "thickness_list": [0] + [100e-9, 60e-9] * _n_pairs + [20e-9, 0],
+        "incident_angle": 20.0,
+        "polarization": "s",
+    }
+    ts = sf.spectrum_factory("Tmm", test_args)
+
+    _ri = ts._refractive_index_array
+    _k0 = ts._k0_array
+    _kz = ts._kz_array
+    _d = ts.thickness_array
+
+    # only the SiO2, TiO2 and Ag layer matrices are built
+    _labels, _unique_layers = ts._label_intermediate_layers(_ri, _d)
+    assert _unique_layers == [1, 2, 2 * _n_pairs + 1]
+    assert _labels == (0, 1) * _n_pairs + (2,)
+
+    # the bilayers collapse to one run followed by the Ag layer
+    _runs = ts._periodic_runs_from_labels(_labels)
+    assert _runs == [(1, 2, _n_pairs), (2 * _n_pairs + 1, 1, 1)]
+
+    M, _, _ = ts._compute_tm(_ri, _k0, _kz, _d)
+
+    # the forward pass with no tangents is the plain layer-by-layer product
+    expected_M, _, _, _ = ts._compute_tm_jvp(
+        _ri, _k0, _kz, _d, np.zeros((1, ts.number_of_layers))
+    )
+    assert np.allclose(M, expected_M)
+
+    # the runs are reused while the structure is unchanged
+    assert ts._periodic_runs_from_labels(_labels) is _runs
+
+    # and recomputed after an in-place thickness change breaks the period
+    ts.thickness_array[3] = 120e-9
+    _labels, _ = ts._label_intermediate_layers(_ri, _d)
+    assert ts._periodic_runs_from_labels(_labels) == [
+        (1, 1, 1),
+        (2, 1, 1),
+        (3, 1, 1),
+        (4, 2, _n_pairs - 2),
+        (2 * _n_pairs, 1, 1),
+        (2 * _n_pairs + 1, 1, 1),
+    ]
+    M, _, _ = ts._compute_tm(_ri, _k0, _kz, _d)
+    expected_M, _, _, _ = ts._compute_tm_jvp(
+        _ri, _k0, _kz, _d, np.zeros((1, ts.number_of_layers))
+    )
+    assert np.allclose(M, expected_M)
+
+
 def test_selective_mirror_fom():
     """
     Test the computation of the selective mirror figure of merit against the following cases:
@@ -8,10 +8,14 @@ import numpy as np
 import pytest
 import sys
 
-material_test = wptherml.Materials()
+@pytest.fixture(scope="session")
+def material_test():
+    """a single Materials instance shared by every test; the tabulated data
+    files are cached by _read_data_file, so each file is read at most once"""
+    return wptherml.Materials()
 
 
-def test_material_from_file():
+def test_material_from_file(material_test):
     """tests material_from_file method using filenames for the SiO2 and TiN files,
     specifically "SiO2_ir.txt" using tabulated n and k at lambda=636 nm of 6.359999999E-7 1.45693 0.00000
     and "TiN_ellipsometry_data.txt" using tabulated n and k at lambda=1106 nm of 1.106906906906907e-06 2.175019337515494 5.175973473259225
@@ -44,7 +48,7 @@ def test_material_from_file():
     assert np.isclose(_result_tin_k, _expected_tin_k, 1e-3)
 
 
-def test_material_sio2():
+def test_material_sio2(material_test):
     """tests material_sio2 method using tabulated n and k at lambda=636 nm
     6.359999999E-7 1.45693 0.00000"""
 
@@ -62,7 +66,7 @@ def test_material_sio2():
     assert np.isclose(result_n, expected_n, 1e-3)
     assert np.isclose(result_k, expected_k, 1e-3)
 
-def test_material_sio2_udm():
+def test_material_sio2_udm(material_test):
     """tests material_sio2_udm method using tabulated n and k at en = 0.01207 eV:
        1.207814e-02	2.046290e+00	3.283908e-02
     """
@@ -85,7 +89,7 @@ def test_material_sio2_udm():
     assert np.isclose(result_n, expected_n, 1e-3)
     assert np.isclose(result_k, expected_k, 1e-3)
 
-def test_material_si3n4():
+def test_material_si3n4(material_test):
     """tests material_si3n4 method using tabulated n and k at lambda = 3.738 microns
        0.000003738	1.913747161	0
     """
@@ -106,7 +110,7 @@ def test_material_si3n4():
     assert np.isclose(result_n, expected_n, 1e-3)
     assert np.isclose(result_k, expected_k, 1e-3)
 
-def test_material_zro2():
+def test_material_zro2(material_test):
     """tests material_zro2 method using tabulated n and k at lambda = 695.2 nm 
        6.952E-07	2.144155168	0
     """
@@ -127,7 +131,7 @@ def test_material_zro2():
     assert np.isclose(result_n, expected_n, 1e-3)
     assert np.isclose(result_k, expected_k, 1e-3)
 
-def test_material_h2o():
+def test_material_h2o(material_test):
     """tests material_H2O method using the fact that n = 1.33 + 0j for all lambda"""
 
     expected_n = 1.33
@@ -145,7 +149,7 @@ def test_material_h2o():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_tio2():
+def test_material_tio2(material_test):
     """tests material_tio2 method using tabulated n and k at lambda=664 nm
     6.639999999E-7 2.377021563 6.79e-10"""
 
@@ -164,7 +168,7 @@ def test_material_tio2():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_ta2o5():
+def test_material_ta2o5(material_test):
     """Dictionaries from material_Ta2O5"""
     data1 = {
         "file": "data/Ta2O5_Rodriguez.txt",
@@ -213,7 +217,7 @@ def test_material_ta2o5():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_tin():
+def test_material_tin(material_test):
     """tests material_TiN method using tabulated n and k at lambda=1106 nm
     1.106906906906907e-06 2.175019337515494 5.175973473259225"""
 
@@ -232,7 +236,7 @@ def test_material_tin():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_al():
+def test_material_al(material_test):
     """tests material_Al method using tabulated n and k at lambda=206.64 nm
     2.06640E-07	1.26770E-01	2.35630E+00"""
 
@@ -252,7 +256,7 @@ def test_material_al():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_hfo2():
+def test_material_hfo2(material_test):
     """tests material_HfO2 method using tabulated n and k at lambda=1082.00 nm
     1.082000E-06 1.880787E+00 0.000000E+00"""
 
@@ -272,7 +276,7 @@ def test_material_hfo2():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_au():
+def test_material_au(material_test):
     """Dictionaries from material_Au"""
     data1 = {
         "file": "data/Au_JC_RI_f.txt",
@@ -321,7 +325,7 @@ def test_material_au():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_pt():
+def test_material_pt(material_test):
     """tests material_Pt method using tabulated n and k at lambda=610 nm
     6.1096e-06 5.4685e+00 2.4477e+01"""
 
@@ -339,7 +343,7 @@ def test_material_pt():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_al2o3():
+def test_material_al2o3(material_test):
     """tests material_al2o3 method using tabulated n and k at lambda=500 nm
     5.00E-07 1.74007 0"""
 
@@ -357,7 +361,7 @@ def test_material_al2o3():
     assert np.isclose(result_n, expected_n, 1e-3)
     assert np.isclose(result_k, expected_k, 1e-3)
 
-def test_material_al2o3_udm():
+def test_material_al2o3_udm(material_test):
     """tests material_al2o3_udm method using tabulated n and k at en = 0.01455 eV:
        1.455459e-02	2.498235e+00	6.013373e-03
     """
@@ -381,7 +385,7 @@ def test_material_al2o3_udm():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_polystyrene():
+def test_material_polystyrene(material_test):
     """tests material_Polystyrene method using tabulated n and k at lambda=500 nm
     0.0000005	1.60021	6.11E-07"""
 
@@ -400,7 +404,7 @@ def test_material_polystyrene():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_rh():
+def test_material_rh(material_test):
     """tests material_Rh method using tabulated n and k at lambda=564 nm
     5.636E-07	2	5.11"""
 
@@ -418,7 +422,7 @@ def test_material_rh():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_ru():
+def test_material_ru(material_test):
     """tests material_Ru method using tabulated n and k at lambda=750 nm
     0.0000007508  5.1101514677  4.1107371518"""
 
@@ -436,7 +440,7 @@ def test_material_ru():
     assert np.isclose(result_k, expected_k, 1e-3)
 
 
-def test_material_aln():
+def test_material_aln(material_test):
     """Dictionaries from material_AlN"""
     data1 = {
         "file": "data/AlN_Pastrnak.txt",
@@ -485,7 +489,7 @@ def test_material_aln():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_w():
+def test_material_w(material_test):
     """Dictionaries from material_W"""
     data1 = {
         "file": "data/W_Rakic.txt",
@@ -535,7 +539,7 @@ def test_material_w():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_si():
+def test_material_si(material_test):
     """Dictionaries from material_Si"""
     data1 = {
         "file": "data/Si_Schinke.txt",
@@ -585,7 +589,7 @@ def test_material_si():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_re():
+def test_material_re(material_test):
     """Dictionaries from material_Re"""
     data1 = {
         "file": "data/Re_Windt.txt",
@@ -635,7 +639,7 @@ def test_material_re():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_ag():
+def test_material_ag(material_test):
     """Dictionaries from material_Ag"""
     data1 = {
         "file": "data/Ag_JC.txt",
@@ -685,7 +689,7 @@ def test_material_ag():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_material_pb():
+def test_material_pb(material_test):
     """Dictionaries from material_Pb"""
     data1 = {
         "file": "data/Pb_Werner.txt",
@@ -735,7 +739,7 @@ def test_material_pb():
     assert np.isclose(result_k_2, expected_k_2, 1e-3)
 
 
-def test_read_AM():
+def test_read_AM(material_test):
 
     # create test multilayer for a wavelength array centered at 615 nm
     material_test._create_test_multilayer(central_wavelength=615e-9)
@@ -750,7 +754,7 @@ def test_read_AM():
     assert np.isclose(_AM_15_data[1], _expected_value, 1e-3)
 
 
-def test_read_atmospheric_transmissivity():
+def test_read_atmospheric_transmissivity(material_test):
 
     # create test multilayer for a wavelength array centered at 7.1034 microns
     material_test._create_test_multilayer(central_wavelength=7.1034e-6)
@@ -763,3 +767,66 @@ def test_read_atmospheric_transmissivity():
 
     # test to see if the expected value is close to the read value
     assert np.isclose(_atmospheric_transmissivity[1], _expected_value, 1e-3)
+
+
+def test_read_data_file_cache(material_test):
+    """tests that repeated reads of the same refractive index file
+    return the same cached, read-only array and that materials
+    defined from the cached data are unchanged"""
+    from wptherml.materials import _read_data_file, path
+
+    _file_path = path + "data/SiO2_ir.txt"
+    _data_1 = _read_data_file(_file_path)
+    _data_2 = _read_data_file(_file_path)
+
+    assert _data_1 is _data_2
+    assert not _data_1.flags.writeable
+
+    # define central layer as SiO2 twice; second call uses the cached table
+    material_test._create_test_multilayer(central_wavelength=636e-9)
+    material_test.material_SiO2(1)
+    _first_result = np.copy(material_test._refractive_index_array[:, 1])
+    material_test.material_SiO2(1)
+
+    assert np.allclose(material_test._refractive_index_array[:, 1], _first_result)
+    assert np.isclose(np.real(_first_result[1]), 1.45693, 1e-3)
+
+
+def test_interpolate_linear(material_test):
+    """tests that the np.interp based interpolation of tabulated n + ik data
+    matches a linear spline inside the table and extrapolates the end
+    segments linearly outside of it"""
+    from scipy.interpolate import InterpolatedUnivariateSpline
+    from wptherml.materials import _interpolate_linear, _read_data_file, path
+
+    _data = _read_data_file(path + "data/SiO2_ir.txt")
+    _idx = material_test._find_unique_ri_file_data(_data[:, 0])
+    _wl = _data[_idx, 0]
+    _n = _data[_idx, 1]
+    _k = _data[_idx, 2]
+
+    # points inside and on both sides of the tabulated range
+    _x = np.linspace(0.5 * _wl[0], 1.5 * _wl[-1], 101)
+
+    _expected = InterpolatedUnivariateSpline(_wl, _n, k=1)(
+        _x
+    ) + 1j * InterpolatedUnivariateSpline(_wl, _k, k=1)(_x)
+
+    assert np.allclose(_interpolate_linear(_x, _wl, _n + 1j * _k), _expected)
+
+
+def test_set_material(material_test):
+    """tests that _set_material dispatches material names case-insensitively
+    to the material_* methods and reports unknown names"""
+    material_test._create_test_multilayer(central_wavelength=636e-9)
+    material_test.material_SiO2(1)
+    _expected = np.copy(material_test._refractive_index_array[:, 1])
+
+    material_test._create_test_multilayer(central_wavelength=636e-9)
+    assert material_test._set_material(1, "sio2")
+    assert np.allclose(material_test._refractive_index_array[:, 1], _expected)
+
+    assert material_test._set_material(1, "VACUUM")
+    assert np.allclose(material_test._refractive_index_array[:, 1], 1.0 + 0j)
+
+    assert not material_test._set_material(1, "not_a_material.txt")
@@ -242,3 +242,70 @@ def test_compute_cooling_gradient():
         _numeric_atmospheric_warming_power_gradient,
         1e-2,
     )
+
+
+def test_blackbody_spectrum_cache():
+    """will test that the blackbody spectrum and k0 are computed once per
+    wavelength_array and temperature, and recomputed when a new
+    wavelength_array is assigned
+    """
+    test_args = {
+        "wavelength_list": [400e-9, 7000e-9, 100],
+        "material_list": ["Air", "TiN", "Air"],
+        "thickness_list": [0, 400e-9, 0],
+        "temperature": 1500,
+        "therml": True,
+    }
+    sf = wptherml.SpectrumFactory()
+    test = sf.spectrum_factory("Tmm", test_args)
+
+    _bb_1 = test._compute_blackbody_spectrum(test.wavelength_array, 1500)
+    _bb_2 = test._compute_blackbody_spectrum(test.wavelength_array, 1500)
+    assert _bb_1 is _bb_2
+    assert not _bb_1.flags.writeable
+
+    # structure -> ambient -> structure, as in compute_cooling, hits the cache
+    _bb_3 = test._compute_blackbody_spectrum(test.wavelength_array, 300)
+    assert np.all(_bb_3 < _bb_1)
+    assert test._compute_blackbody_spectrum(test.wavelength_array, 1500) is _bb_1
+    assert test._compute_blackbody_spectrum(test.wavelength_array, 300) is _bb_3
+
+    # the cache is bounded, evicting the oldest temperature first
+    for _T in range(2000, 2000 + 100 * wptherml.therml._BLACKBODY_CACHE_SIZE, 100):
+        test._compute_blackbody_spectrum(test.wavelength_array, _T)
+    assert len(test._spectrum_cache["blackbody"]) == wptherml.therml._BLACKBODY_CACHE_SIZE
+    assert test._compute_blackbody_spectrum(test.wavelength_array, 1500) is not _bb_1
+    assert len(test._spectrum_cache) == 2
+
+    # editing wavelength_array in place also invalidates the cache
+    test.wavelength_array[:] = np.linspace(450e-9, 7500e-9, 100)
+    test._compute_k0()
+    assert np.allclose(test._k0_array, 2 * np.pi / test.wavelength_array)
+    _expected = test._compute_blackbody_spectrum(np.copy(test.wavelength_array), 1500)
+    assert np.allclose(
+        test._compute_blackbody_spectrum(test.wavelength_array, 1500), _expected
+    )
+
+    # assigning a new wavelength_array invalidates the cache
+    test.wavelength_array = np.linspace(500e-9, 8000e-9, 100)
+    test._compute_k0()
+    assert np.allclose(test._k0_array, 2 * np.pi / test.wavelength_array)
+
+    _bb_4 = test._compute_blackbody_spectrum(test.wavelength_array, 1500)
+    _expected = test._compute_blackbody_spectrum(np.copy(test.wavelength_array), 1500)
+    assert _bb_4 is not _bb_1
+    assert np.allclose(_bb_4, _expected)
+
+
+def test_standalone_therml_blackbody_spectrum():
+    """will test that a standalone Therml, which has no spectrum cache,
+    still computes the thermal emission spectrum
+    """
+    test = wptherml.Therml({"temperature": 1500})
+    test.wavelength_array = np.linspace(400e-9, 7000e-9, 100)
+    _emissivity = 0.5 * np.ones_like(test.wavelength_array)
+
+    test._compute_therml_spectrum(test.wavelength_array, _emissivity)
+    _expected = test._compute_blackbody_spectrum(np.copy(test.wavelength_array), 1500)
+    assert np.allclose(test.blackbody_spectrum, _expected)
+    assert np.allclose(test.thermal_emission_array, 0.5 * _expected)
@@ -1,6 +1,11 @@
 import numpy as np
 from scipy.interpolate import UnivariateSpline
 
+# number of temperatures whose blackbody spectra are cached; at least two so that
+# alternating between the structure and the atmosphere temperature (compute_cooling)
+# keeps hitting the cache
+_BLACKBODY_CACHE_SIZE = 4
+
 
 class Therml:
     """Collects methods for the computation of thermal radiative figures of merit
@@ -20,7 +25,8 @@ class Therml:
         angle of the incident solar spectrum in radians
 
     self.blackbody_spectrum : numpy array of floats
-        Planck's blackbody spectrum for a given temperature
+        Planck's blackbody spectrum for a given temperature; the array is shared
+        with the blackbody cache and is read-only, so copy it before modifying it
 
     self.thermal_emission_array : numpy array of floats
         thermal emission spectrum of structure for a given temperature
@@ -169,6 +175,35 @@ class Therml:
             )
 
     def _compute_blackbody_spectrum(self, wavelength_array, T):
+        """method to compute Planck's blackbody spectrum at temperature T
+
+        Arguments
+        ---------
+        wavelength_array : numpy array of floats
+            the array of wavelengths across which the blackbody spectrum will be computed
+
+        T : float
+            the temperature in Kelvin
+
+        Returns
+        -------
+        _bb_spectrum : numpy array of floats
+            the blackbody spectrum; when wavelength_array is the structure's own
+            wavelength_array of a SpectrumDriver, the spectra of the most recent
+            _BLACKBODY_CACHE_SIZE temperatures are cached (and shared, so they are
+            read-only) until the wavelengths change
+        """
+        # the cache lives on SpectrumDriver, so a standalone Therml always recomputes
+        _use_cache = hasattr(self, "_get_spectrum_cache") and (
+            wavelength_array is getattr(self, "wavelength_array", None)
+        )
+        if _use_cache:
+            # the cache is bounded so that temperature sweeps and the
+            # self-consistent temperature loop do not grow it
+            _bb_cache = self._get_spectrum_cache().setdefault("blackbody", {})
+            if T in _bb_cache:
+                return _bb_cache[T]
+
         # speed of light in SI
         c = 299792458
         # plancks constant in SI
@@ -180,6 +215,13 @@ class Therml:
         _bb_spectrum /= (
             np.exp(h * c / (wavelength_array * kb * T)) - 1
         )
+
+        if _use_cache:
+            _bb_spectrum.setflags(write=False)
+            if len(_bb_cache) >= _BLACKBODY_CACHE_SIZE:
+                # evict the oldest temperature
+                del _bb_cache[next(iter(_bb_cache))]
+            _bb_cache[T] = _bb_spectrum
         return _bb_spectrum 
 
     def _compute_pv_stpv_power_density(self, wavelength_array):
@@ -533,20 +575,17 @@ class Therml:
         See Eq. (2) of https://www.nature.com/articles/nature13883
         """
 
-        num_angles = len(theta_vals)
         self._compute_therml_spectrum(wavelength_array, emissivity_array_s[0, :])
 
-        # loop over angles
-        P_rad = 0.0
-        for i in range(0, num_angles):
-            _TE = (
-                self.blackbody_spectrum
-                * np.cos(theta_vals[i])
-                * 0.5
-                * (emissivity_array_p[i, :] + emissivity_array_s[i, :])
-            )
-            _TE_INT = np.trapz(_TE, wavelength_array)
-            P_rad += _TE_INT * np.sin(theta_vals[i]) * theta_weights[i]
+        # thermal emission for all angles at once: angles along axis 0, wavelengths along axis 1
+        _TE = (
+            self.blackbody_spectrum
+            * np.cos(theta_vals)[:, np.newaxis]
+            * 0.5
+            * (emissivity_array_p + emissivity_array_s)
+        )
+        _TE_INT = np.trapz(_TE, wavelength_array, axis=1)
+        P_rad = np.sum(_TE_INT * np.sin(theta_vals) * theta_weights)
 
         P_rad *= np.pi * 2
 
@@ -575,35 +614,25 @@ class Therml:
         See Eq. (2) of https://www.nature.com/articles/nature13883
 
         """
-        num_angles = len(theta_vals)
         # we don't care about the emissivity - just calling this for the blackbody spectrum
         self._compute_therml_spectrum(
             wavelength_array, emissivity_gradient_array_p[0, :, 0]
         )
 
-        _ngr = len(emissivity_gradient_array_s[0, 0, :])
-        _nth = len(emissivity_gradient_array_s[:, 0, 0])
-
-        # instantiate P_rad_prime
-        _emitted_thermal_spectrum_gradient = np.zeros(_ngr)
-        for i in range(0, _ngr):
-            _P_rad_prime = 0
-            for j in range(0, _nth):
-                _TE = (
-                    self.blackbody_spectrum
-                    * np.cos(theta_vals[j])
-                    * 0.5
-                    * (
-                        emissivity_gradient_array_p[j, :, i]
-                        + emissivity_gradient_array_s[j, :, i]
-                    )
-                )
-                _TE_INT = np.trapz(_TE, wavelength_array)
+        # gradient of the thermal emission for all angles and layers at once:
+        # angles along axis 0, wavelengths along axis 1, layers along axis 2
+        _TE = (
+            self.blackbody_spectrum[np.newaxis, :, np.newaxis]
+            * np.cos(theta_vals)[:, np.newaxis, np.newaxis]
+            * 0.5
+            * (emissivity_gradient_array_p + emissivity_gradient_array_s)
+        )
+        _TE_INT = np.trapz(_TE, wavelength_array, axis=1)
 
-                _P_rad_prime += (
-                    2 * np.pi * _TE_INT * np.sin(theta_vals[j]) * theta_weights[j]
-                )
-            _emitted_thermal_spectrum_gradient[i] = _P_rad_prime
+        _emitted_thermal_spectrum_gradient = np.sum(
+            2 * np.pi * _TE_INT * (np.sin(theta_vals) * theta_weights)[:, np.newaxis],
+            axis=0,
+        )
 
         return _emitted_thermal_spectrum_gradient
 
@@ -631,8 +660,6 @@ class Therml:
         See Eq. (3) of https://www.nature.com/articles/nature13883
 
         """
-        num_angles = len(theta_vals)
-
         # make sure we are getting the blackbody spectrum of the atmosphere
         # store the structure temperature
         _T_temp = self.temperature
@@ -643,20 +670,18 @@ class Therml:
         # set the structure temperature back to _T_temp in case
         # one wants to compute the thermal emission of the structure again!
         self.temperature = _T_temp
-        P_atm = 0.0
-        for i in range(0, num_angles):
-            # get the term that goes in the exponent of the atmospheric transmissivity
-            _o_over_cos_t = 1 / np.cos(theta_vals[i])
-            _emissivity_atm = (
-                np.ones(len(atmospheric_transmissivity))
-                - atmospheric_transmissivity ** _o_over_cos_t
-            )
-            _TE_atm = self.blackbody_spectrum * _emissivity_atm * np.cos(theta_vals[i])
-            _absorbed_TE_spectrum = (
-                _TE_atm * 0.5 * (emissivity_array_p[i, :] + emissivity_array_s[i, :])
-            )
-            _absorbed_TE = np.trapz(_absorbed_TE_spectrum, wavelength_array)
-            P_atm += _absorbed_TE * np.sin(theta_vals[i]) * theta_weights[i]
+        # get the term that goes in the exponent of the atmospheric transmissivity
+        # for all angles at once: angles along axis 0, wavelengths along axis 1
+        _o_over_cos_t = 1 / np.cos(theta_vals)[:, np.newaxis]
+        _emissivity_atm = 1 - atmospheric_transmissivity ** _o_over_cos_t
+        _TE_atm = (
+            self.blackbody_spectrum * _emissivity_atm * np.cos(theta_vals)[:, np.newaxis]
+        )
+        _absorbed_TE_spectrum = (
+            _TE_atm * 0.5 * (emissivity_array_p + emissivity_array_s)
+        )
+        _absorbed_TE = np.trapz(_absorbed_TE_spectrum, wavelength_array, axis=1)
+        P_atm = np.sum(_absorbed_TE * np.sin(theta_vals) * theta_weights)
         P_atm *= 2 * np.pi
 
         return P_atm
@@ -681,10 +706,6 @@ class Therml:
         _absorbed_solar_spectrum_gradient
         """
 
-        _nth = len(theta_vals)
-        _ngr = len(emissivity_gradient_array_p[0, 0, :])
-        _absorbed_atmospheric_radiation_gradient = np.zeros(_ngr)
-
         # make sure we are getting the blackbody spectrum of the atmosphere
         # store the structure temperature
         _T_temp = self.temperature
@@ -698,31 +719,28 @@ class Therml:
         # one wants to compute the thermal emission of the structure again!
         self.temperature = _T_temp
 
-        for i in range(0, _ngr):
-            P_atm_prime = 0
-            for j in range(0, _nth):
-                # get the term that goes in the exponent of the atmospheric transmissivity
-                _o_over_cos_t = 1 / np.cos(theta_vals[j])
-                _emissivity_atm = (
-                    np.ones(len(atmospheric_transmissivity))
-                    - atmospheric_transmissivity ** _o_over_cos_t
-                )
-                _TE_atm = (
-                    self.blackbody_spectrum * _emissivity_atm * np.cos(theta_vals[j])
-                )
-                _absorbed_TE_spectrum = (
-                    _TE_atm
-                    * 0.5
-                    * (
-                        emissivity_gradient_array_p[j, :, i]
-                        + emissivity_gradient_array_s[j, :, i]
-                    )
-                )
-                _absorbed_TE = np.trapz(_absorbed_TE_spectrum, wavelength_array)
-                P_atm_prime += (
-                    2 * np.pi * _absorbed_TE * np.sin(theta_vals[j]) * theta_weights[j]
-                )
-            _absorbed_atmospheric_radiation_gradient[i] = P_atm_prime
+        # get the term that goes in the exponent of the atmospheric transmissivity
+        # for all angles at once: angles along axis 0, wavelengths along axis 1
+        _o_over_cos_t = 1 / np.cos(theta_vals)[:, np.newaxis]
+        _emissivity_atm = 1 - atmospheric_transmissivity ** _o_over_cos_t
+        _TE_atm = (
+            self.blackbody_spectrum * _emissivity_atm * np.cos(theta_vals)[:, np.newaxis]
+        )
+
+        # layers along axis 2
+        _absorbed_TE_spectrum = (
+            _TE_atm[:, :, np.newaxis]
+            * 0.5
+            * (emissivity_gradient_array_p + emissivity_gradient_array_s)
+        )
+        _absorbed_TE = np.trapz(_absorbed_TE_spectrum, wavelength_array, axis=1)
+        _absorbed_atmospheric_radiation_gradient = np.sum(
+            2
+            * np.pi
+            * _absorbed_TE
+            * (np.sin(theta_vals) * theta_weights)[:, np.newaxis],
+            axis=0,
+        )
 
         return _absorbed_atmospheric_radiation_gradient
 